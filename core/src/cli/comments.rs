@@ -7,7 +7,7 @@
 //! comments can coexist in the same review.
 
 use std::cell::Cell;
-use std::io::Read;
+use std::io::{self, Read, Write};
 use std::path::{Path, PathBuf};
 use std::process::Command;
 
@@ -18,8 +18,8 @@ use crate::review::state::{now_iso8601, AnnotationSide, LineAnnotation, ReviewSt
 use crate::review::storage;
 
 use super::common::{
-    line_range, load_for_mutation, mutate_review, print_json, reject_blank, resolve_review_arg,
-    resolve_source, ReviewTarget,
+    line_range, load_for_mutation, mutate_review, print_human, print_json, reject_blank,
+    resolve_review_arg, resolve_source, ReviewTarget,
 };
 use super::get_repo_path;
 
@@ -265,32 +265,43 @@ pub fn run_comments(args: CommentsArgs) -> Result<(), String> {
             comments: sorted,
         });
     } else {
-        print_comments_human(&comparison.key, state.annotations.len(), &sorted);
+        print_human(|out| {
+            print_comments_human(out, &comparison.key, state.annotations.len(), &sorted)
+        });
     }
     Ok(())
 }
 
-fn print_comments_human(comparison: &str, total: usize, rows: &[&LineAnnotation]) {
+fn print_comments_human(
+    out: &mut dyn Write,
+    comparison: &str,
+    total: usize,
+    rows: &[&LineAnnotation],
+) -> io::Result<()> {
     if rows.is_empty() {
         if total == 0 {
-            println!("(no comments on {comparison})");
+            writeln!(out, "(no comments on {comparison})")?;
         } else {
-            println!("(no comments match the filter; {total} total on {comparison})");
+            writeln!(
+                out,
+                "(no comments match the filter; {total} total on {comparison})"
+            )?;
         }
-        return;
+        return Ok(());
     }
     let resolved_count = rows.iter().filter(|a| a.resolved_at.is_some()).count();
     let open_count = rows.len() - resolved_count;
-    println!(
+    writeln!(
+        out,
         "{} comment(s) on {comparison} · {} open · {} resolved\n",
         rows.len(),
         open_count,
         resolved_count
-    );
+    )?;
     let mut current_file = "";
     for row in rows {
         if row.file_path.as_str() != current_file {
-            println!("{}", row.file_path);
+            writeln!(out, "{}", row.file_path)?;
             current_file = row.file_path.as_str();
         }
         let range = line_range(row.line_number, row.end_line_number);
@@ -300,11 +311,12 @@ fn print_comments_human(comparison: &str, total: usize, rows: &[&LineAnnotation]
         } else {
             ""
         };
-        println!("  :{range:<8}  {}  by {author}{resolved}", row.id);
+        writeln!(out, "  :{range:<8}  {}  by {author}{resolved}", row.id)?;
         for line in row.content.lines() {
-            println!("      {line}");
+            writeln!(out, "      {line}")?;
         }
     }
+    Ok(())
 }
 
 /// `review comment add` — leave a comment on a file:line.
@@ -2,6 +2,7 @@
 //! staging, and review-state mutations).
 
 use std::collections::HashSet;
+use std::io::Write;
 use std::path::Path;
 use std::sync::atomic::{AtomicU64, Ordering};
 
@@ -10,9 +11,10 @@ use serde::Serialize;
 
 use crate::classify::{classify_hunks_static, ClassifyResponse};
 use crate::diff::parser::{DiffHunk, LineType};
-use crate::review::state::{Attributed, HunkStatus, ReviewState, Source};
+use crate::review::state::{Attributed, HunkState, HunkStatus, ReviewState, Source};
 use crate::review::storage::{self, StorageError};
 use crate::service::targets::{self, ResolvedReview};
+use crate::trust::TrustSet;
 
 /// The `--repo` / `--spec` flags shared by the review-state subcommands.
 ///
@@ -114,19 +116,14 @@ pub fn line_range(start: u32, end: Option<u32>) -> String {
 /// Base resolution then layers three sources, most specific first: an explicit
 /// base on the spec (`base..ref`) wins; otherwise the review's stored
 /// `base_override` (set by `change-base`) applies; otherwise the ladder in
-/// [`targets::resolve_review`] derives it.
+/// [`targets::resolve_review`] derives it. The stored override is applied by
+/// [`targets::resolve`], which loads the review state anyway.
 pub fn resolve_review_arg(repo: &Path, spec: Option<&str>) -> Result<ResolvedReview, String> {
     let (ref_name, spec_base) = match effective_spec(repo, spec) {
         Some(spec) => super::parse_review_spec(&spec)?,
         None => (super::auto_detect_ref(repo)?, None),
     };
-    let base_override = match spec_base {
-        Some(base) => Some(base),
-        None => storage::load_review_state(repo, &ref_name)
-            .ok()
-            .and_then(|state| state.base_override),
-    };
-    targets::resolve(repo, &ref_name, base_override.as_deref()).map_err(|e| e.to_string())
+    targets::resolve(repo, &ref_name, spec_base.as_deref()).map_err(|e| e.to_string())
 }
 
 /// Trim `s` and return it as an owned string, unless it's blank.
@@ -187,25 +184,29 @@ pub fn render_hunk_diff(hunk: &DiffHunk) -> String {
 }
 
 /// The static-classification labels recorded for a hunk ID.
-pub fn classified_labels(classification: &ClassifyResponse, hunk_id: &str) -> Vec<String> {
+///
+/// Borrowed rather than cloned: callers tally or filter every hunk in the
+/// comparison but only copy labels for the rows they actually print.
+pub fn classified_labels<'a>(classification: &'a ClassifyResponse, hunk_id: &str) -> &'a [String] {
     classification
         .classifications
         .get(hunk_id)
-        .map(|c| c.label.clone())
-        .unwrap_or_default()
+        .map(|c| c.label.as_slice())
+        .unwrap_or(&[])
 }
 
 /// The labels for a hunk: stored review labels take precedence over a fresh
-/// static classification.
-pub fn hunk_labels(
+/// static classification. `hunk_state` is the hunk's entry in the review
+/// state, looked up once by the caller.
+pub fn hunk_labels<'a>(
     hunk_id: &str,
-    state: &ReviewState,
-    classification: &ClassifyResponse,
-) -> Vec<String> {
-    if let Some(hunk_state) = state.hunks.get(hunk_id) {
+    hunk_state: Option<&'a HunkState>,
+    classification: &'a ClassifyResponse,
+) -> &'a [String] {
+    if let Some(hunk_state) = hunk_state {
         let labels = hunk_state.labels();
         if !labels.is_empty() {
-            return labels.to_vec();
+            return labels;
         }
     }
     classified_labels(classification, hunk_id)
@@ -214,8 +215,9 @@ pub fn hunk_labels(
 /// Persist static-classification labels into the review state so summaries
 /// — `review list` and the desktop app's sidebar — see every classified
 /// hunk, matching what the app stores. Existing labels (e.g. from the app's
-/// AI classification) are left untouched.
-pub fn sync_classification(state: &mut ReviewState, classification: &ClassifyResponse) {
+/// AI classification) are left untouched. Returns whether any label was added.
+pub fn sync_classification(state: &mut ReviewState, classification: &ClassifyResponse) -> bool {
+    let mut changed = false;
     for (hunk_id, result) in &classification.classifications {
         if result.label.is_empty() {
             continue;
@@ -227,14 +229,20 @@ pub fn sync_classification(state: &mut ReviewState, classification: &ClassifyRes
                 source: Source::Static,
                 reasoning: (!result.reasoning.is_empty()).then(|| result.reasoning.clone()),
             });
+            changed = true;
         }
     }
+    changed
 }
 
 /// Effective review status of a hunk: an explicit status if one is set, else
-/// `Trusted` when a label matches the trust list, else `Unreviewed`.
-pub fn effective_status(hunk_id: &str, labels: &[String], state: &ReviewState) -> EffectiveStatus {
-    let hunk_state = state.hunks.get(hunk_id);
+/// `Trusted` when a label matches the trust list, else `Unreviewed`. `trust`
+/// is `state.trust_set()`, built once by the caller for the whole hunk list.
+pub fn effective_status(
+    hunk_state: Option<&HunkState>,
+    labels: &[String],
+    trust: &TrustSet,
+) -> EffectiveStatus {
     if let Some(hunk_state) = hunk_state {
         if let Some(status) = &hunk_state.status {
             return match &status.value {
@@ -244,7 +252,7 @@ pub fn effective_status(hunk_id: &str, labels: &[String], state: &ReviewState) -
             };
         }
     }
-    if state.labels_trusted(labels) {
+    if trust.matches_any(labels) {
         EffectiveStatus::Trusted
     } else {
         EffectiveStatus::Unreviewed
@@ -378,13 +386,37 @@ pub fn reject_blank(field: &str, value: &str) -> Result<(), String> {
 }
 
 /// Print a value as pretty JSON to stdout.
+///
+/// Streams straight into a buffered stdout rather than building the whole
+/// document as a `String` first — `review hunks --json` on a large diff would
+/// otherwise hold every hunk twice, once as structs and once as text.
 pub fn print_json<T: Serialize>(value: &T) {
-    match serde_json::to_string_pretty(value) {
-        Ok(text) => println!("{text}"),
+    match write_json(std::io::BufWriter::new(std::io::stdout().lock()), value) {
+        Ok(()) => {}
+        // A closed pipe (`review hunks --json | head`) is a write failure, not
+        // a value serde couldn't represent.
+        Err(e) if e.is_io() => eprintln!("Failed to write output: {e}"),
         Err(e) => eprintln!("Failed to serialize JSON: {e}"),
     }
 }
 
+fn write_json<W: Write, T: Serialize>(mut out: W, value: &T) -> serde_json::Result<()> {
+    serde_json::to_writer_pretty(&mut out, value)?;
+    writeln!(out).map_err(serde_json::Error::io)?;
+    out.flush().map_err(serde_json::Error::io)
+}
+
+/// Run a human-readable printer against a buffered stdout.
+///
+/// `println!` re-locks stdout and, since stdout is line-buffered, issues a
+/// write per line — for `--diff` listings that was one syscall per diff line.
+pub fn print_human(print: impl FnOnce(&mut dyn Write) -> std::io::Result<()>) {
+    let mut out = std::io::BufWriter::new(std::io::stdout().lock());
+    if let Err(e) = print(&mut out).and_then(|()| out.flush()) {
+        eprintln!("Failed to write output: {e}");
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -458,4 +490,54 @@ mod tests {
 
         std::env::remove_var("REVIEW_SPEC");
     }
+
+    #[test]
+    fn write_json_tells_write_failures_from_serialize_failures() {
+        struct ClosedPipe;
+        impl Write for ClosedPipe {
+            fn write(&mut self, _: &[u8]) -> std::io::Result<usize> {
+                Err(std::io::ErrorKind::BrokenPipe.into())
+            }
+            fn flush(&mut self) -> std::io::Result<()> {
+                Ok(())
+            }
+        }
+
+        assert!(write_json(ClosedPipe, &["a"]).unwrap_err().is_io());
+        // JSON object keys must be strings.
+        let unrepresentable = std::collections::HashMap::from([((1, 2), 3)]);
+        assert!(!write_json(Vec::new(), &unrepresentable)
+            .unwrap_err()
+            .is_io());
+    }
+
+    #[test]
+    fn sync_classification_reports_only_new_labels() {
+        let classification = ClassifyResponse {
+            classifications: [
+                ("a.rs:1111111111111111", vec!["imports:added".to_owned()]),
+                ("b.rs:2222222222222222", Vec::new()),
+            ]
+            .into_iter()
+            .map(|(id, label)| {
+                let result = crate::classify::ClassificationResult {
+                    label,
+                    reasoning: String::new(),
+                };
+                (id.to_owned(), result)
+            })
+            .collect(),
+        };
+        let mut state = ReviewState::new("feature", None);
+
+        assert!(sync_classification(&mut state, &classification));
+        // Nothing left to add: a repeat must report no change, so mark and
+        // unmark can skip the save.
+        assert!(!sync_classification(&mut state, &classification));
+        assert_eq!(state.hunks.len(), 1, "an empty label adds no entry");
+        assert_eq!(
+            state.hunks["a.rs:1111111111111111"].labels(),
+            ["imports:added"]
+        );
+    }
 }
@@ -12,6 +12,7 @@
 
 use std::cell::Cell;
 use std::collections::HashSet;
+use std::io::{self, Write};
 use std::path::PathBuf;
 
 use clap::{Args, Subcommand};
@@ -20,7 +21,8 @@ use serde::Serialize;
 use crate::review::state::{now_iso8601, Guide, GuideGenerated, HunkGroup};
 
 use super::common::{
-    load_for_mutation, load_review_view, mutate_review, print_json, reject_blank, ReviewTarget,
+    load_for_mutation, load_review_view, mutate_review, print_human, print_json, reject_blank,
+    ReviewTarget,
 };
 use super::get_repo_path;
 
@@ -151,49 +153,65 @@ pub fn run_show(args: ShowArgs) -> Result<(), String> {
             generated_at,
         });
     } else {
-        print_guide_human(&view.review.comparison.key, &display_groups, &ungrouped);
+        print_human(|out| {
+            print_guide_human(
+                out,
+                &view.review.comparison.key,
+                &display_groups,
+                &ungrouped,
+            )
+        });
     }
     Ok(())
 }
 
-fn print_guide_human(comparison: &str, groups: &[HunkGroup], ungrouped: &[String]) {
+fn print_guide_human(
+    out: &mut dyn Write,
+    comparison: &str,
+    groups: &[HunkGroup],
+    ungrouped: &[String],
+) -> io::Result<()> {
     if groups.is_empty() && ungrouped.is_empty() {
-        println!("(no hunks to guide on {comparison})");
-        return;
+        writeln!(out, "(no hunks to guide on {comparison})")?;
+        return Ok(());
     }
     if groups.is_empty() {
-        println!(
+        writeln!(
+            out,
             "(no guide on {comparison} — {} hunk(s) ungrouped)",
             ungrouped.len()
-        );
+        )?;
     } else {
         let grouped: usize = groups.iter().map(|g| g.hunk_ids.len()).sum();
-        println!(
+        writeln!(
+            out,
             "{} group(s) on {comparison} · {grouped} hunk(s) grouped · {} ungrouped\n",
             groups.len(),
             ungrouped.len()
-        );
+        )?;
     }
     for (i, group) in groups.iter().enumerate() {
-        println!(
+        writeln!(
+            out,
             "{}. {} ({} hunks)",
             i + 1,
             group.title,
             group.hunk_ids.len()
-        );
+        )?;
         if !group.description.is_empty() {
-            println!("   {}", group.description);
+            writeln!(out, "   {}", group.description)?;
         }
         for id in &group.hunk_ids {
-            println!("     {id}");
+            writeln!(out, "     {id}")?;
         }
     }
     if !ungrouped.is_empty() {
-        println!("\nUngrouped ({}):", ungrouped.len());
+        writeln!(out, "\nUngrouped ({}):", ungrouped.len())?;
         for id in ungrouped {
-            println!("     {id}");
+            writeln!(out, "     {id}")?;
         }
     }
+    Ok(())
 }
 
 /// Reject an empty/whitespace-only group title, matching the comment
@@ -692,7 +692,7 @@ mod tests {
     use super::*;
     use std::process::Command as Cmd;
 
-    fn git(dir: &Path, args: &[&str]) -> String {
+    pub(super) fn git(dir: &Path, args: &[&str]) -> String {
         let out = Cmd::new("git")
             .args(args)
             .current_dir(dir)
@@ -715,7 +715,7 @@ mod tests {
     }
 
     /// Temp repo with `first` (root) and `second` commits; returns (dir, first_sha, second_sha).
-    fn two_commit_repo() -> (tempfile::TempDir, String, String) {
+    pub(super) fn two_commit_repo() -> (tempfile::TempDir, String, String) {
         let dir = tempfile::tempdir().unwrap();
         let p = dir.path();
         git(p, &["init", "-q"]);
@@ -4,12 +4,14 @@
 //! These commands read and write the saved review JSON under `~/.review/`.
 
 use std::collections::HashSet;
+use std::io::{self, Write};
 use std::path::PathBuf;
 
 use clap::{Args, Subcommand};
 use serde::Serialize;
 
 use crate::classify::classify_hunks_static;
+use crate::diff::parser::DiffHunk;
 use crate::review::state::{overall_review_state, Attributed, HunkStatus};
 use crate::review::storage;
 use crate::trust::matches_pattern;
@@ -17,8 +19,8 @@ use crate::trust::matches_pattern;
 use super::comments::SourceArg;
 use super::common::{
     effective_status, hunk_labels, hunk_line_stats, load_for_mutation, load_review_view,
-    mutate_review, print_json, reject_blank, render_hunk_diff, resolve_review_arg, resolve_source,
-    sync_classification, EffectiveStatus, ReviewTarget,
+    mutate_review, print_human, print_json, reject_blank, render_hunk_diff, resolve_review_arg,
+    resolve_source, sync_classification, EffectiveStatus, ReviewTarget,
 };
 use super::get_repo_path;
 
@@ -169,6 +171,57 @@ impl Counts {
     }
 }
 
+/// The `review hunks` filters, parsed and compiled once up front so the
+/// per-hunk check is just the predicates that were actually requested.
+struct HunkFilter<'a> {
+    hunk: Option<&'a str>,
+    status: Option<EffectiveStatus>,
+    file: Option<glob::Pattern>,
+    label: Option<&'a str>,
+}
+
+impl<'a> HunkFilter<'a> {
+    fn from_args(args: &'a HunksArgs) -> Result<Self, String> {
+        let status = match &args.status {
+            Some(value) => Some(parse_status_filter(value)?),
+            None => None,
+        };
+        let file = match &args.file {
+            Some(glob) => {
+                Some(glob::Pattern::new(glob).map_err(|e| format!("Invalid --file pattern: {e}"))?)
+            }
+            None => None,
+        };
+        Ok(Self {
+            hunk: args.hunk.as_deref(),
+            status,
+            file,
+            label: args.label.as_deref(),
+        })
+    }
+
+    /// Whether a hunk passes every requested filter, cheapest checks first.
+    fn matches(&self, hunk: &DiffHunk, status: EffectiveStatus, labels: &[String]) -> bool {
+        if self.hunk.is_some_and(|id| hunk.id != id) {
+            return false;
+        }
+        if self.status.is_some_and(|want| status != want) {
+            return false;
+        }
+        if let Some(pattern) = &self.file {
+            if !pattern.matches(&hunk.file_path) {
+                return false;
+            }
+        }
+        if let Some(label_pattern) = self.label {
+            if !labels.iter().any(|l| matches_pattern(l, label_pattern)) {
+                return false;
+            }
+        }
+        true
+    }
+}
+
 #[derive(Debug, Serialize)]
 #[serde(rename_all = "camelCase")]
 struct HunkJson {
@@ -237,48 +290,23 @@ pub fn run_hunks(args: HunksArgs) -> Result<(), String> {
     let repo = PathBuf::from(get_repo_path(&args.target.repo)?);
     let view = load_review_view(&repo, args.target.spec.as_deref())?;
 
-    let status_filter = match &args.status {
-        Some(value) => Some(parse_status_filter(value)?),
-        None => None,
-    };
-    let file_filter = match &args.file {
-        Some(glob) => {
-            Some(glob::Pattern::new(glob).map_err(|e| format!("Invalid --file pattern: {e}"))?)
-        }
-        None => None,
-    };
+    let filter = HunkFilter::from_args(&args)?;
 
     // Counts always reflect the whole comparison; the printed list is filtered.
     let mut counts = Counts::default();
     let mut rows: Vec<HunkJson> = Vec::new();
+    let trust = view.state.trust_set();
 
     for hunk in &view.hunks {
-        let labels = hunk_labels(&hunk.id, &view.state, &view.classification);
-        let status = effective_status(&hunk.id, &labels, &view.state);
+        let hunk_state = view.state.hunks.get(&hunk.id);
+        let labels = hunk_labels(&hunk.id, hunk_state, &view.classification);
+        let status = effective_status(hunk_state, labels, &trust);
         counts.tally(status);
 
-        if let Some(want) = status_filter {
-            if status != want {
-                continue;
-            }
-        }
-        if let Some(id) = &args.hunk {
-            if &hunk.id != id {
-                continue;
-            }
-        }
-        if let Some(pattern) = &file_filter {
-            if !pattern.matches(&hunk.file_path) {
-                continue;
-            }
-        }
-        if let Some(label_pattern) = &args.label {
-            if !labels.iter().any(|l| matches_pattern(l, label_pattern)) {
-                continue;
-            }
+        if !filter.matches(hunk, status, labels) {
+            continue;
         }
 
-        let hunk_state = view.state.hunks.get(&hunk.id);
         let (additions, deletions) = hunk_line_stats(hunk);
         // Show the most relevant rationale: the decision reason if reviewed,
         // otherwise why it was classified.
@@ -298,7 +326,7 @@ pub fn run_hunks(args: HunksArgs) -> Result<(), String> {
             additions,
             deletions,
             status,
-            labels,
+            labels: labels.to_vec(),
             reasoning,
             // A single-hunk query always includes the diff.
             diff: if args.diff || args.hunk.is_some() {
@@ -317,29 +345,39 @@ pub fn run_hunks(args: HunksArgs) -> Result<(), String> {
             hunks: rows,
         });
     } else {
-        print_hunks_human(
-            &view.review.comparison.key,
-            view.hunks.len(),
-            &counts,
-            &rows,
-        );
+        print_human(|out| {
+            print_hunks_human(
+                out,
+                &view.review.comparison.key,
+                view.hunks.len(),
+                &counts,
+                &rows,
+            )
+        });
     }
     Ok(())
 }
 
-fn print_hunks_human(comparison: &str, total: usize, counts: &Counts, rows: &[HunkJson]) {
-    println!(
+fn print_hunks_human(
+    out: &mut dyn Write,
+    comparison: &str,
+    total: usize,
+    counts: &Counts,
+    rows: &[HunkJson],
+) -> io::Result<()> {
+    writeln!(
+        out,
         "{comparison} — {total} hunks · {} unreviewed · {} trusted · {} approved · {} rejected · {} saved\n",
         counts.unreviewed, counts.trusted, counts.approved, counts.rejected, counts.saved
-    );
+    )?;
     if rows.is_empty() {
-        println!("(no hunks match)");
-        return;
+        writeln!(out, "(no hunks match)")?;
+        return Ok(());
     }
     let mut current_file = "";
     for row in rows {
         if row.file.as_str() != current_file {
-            println!("{}", row.file);
+            writeln!(out, "{}", row.file)?;
             current_file = row.file.as_str();
         }
         let labels = if row.labels.is_empty() {
@@ -347,23 +385,25 @@ fn print_hunks_human(comparison: &str, total: usize, counts: &Counts, rows: &[Hu
         } else {
             format!("  {}", row.labels.join(","))
         };
-        println!(
+        writeln!(
+            out,
             "  {:<10}  {}  +{} -{}{}",
             row.status.as_str(),
             row.id,
             row.additions,
             row.deletions,
             labels
-        );
+        )?;
         if let Some(reason) = &row.reasoning {
-            println!("              reason: {reason}");
+            writeln!(out, "              reason: {reason}")?;
         }
         if let Some(diff) = &row.diff {
             for line in diff.lines() {
-                println!("      {line}");
+                writeln!(out, "      {line}")?;
             }
         }
     }
+    Ok(())
 }
 
 /// `review approve` / `reject` / `save` — set a status on hunks.
@@ -382,17 +422,26 @@ pub fn run_mark(args: MarkArgs, status: HunkStatus) -> Result<(), String> {
     let result = mutate_review(&repo, &review.ref_name, &hunks, |state| {
         // Keep the total and per-hunk labels fresh so `review list` and the
         // desktop app show accurate progress.
+        let mut changed = state.total_diff_hunks != total_hunks;
         state.total_diff_hunks = total_hunks;
-        sync_classification(state, &classification);
+        changed |= sync_classification(state, &classification);
         for id in &known {
             let entry = state.hunks.entry(id.clone()).or_default();
-            entry.status = Some(Attributed {
-                value: status.clone(),
-                source,
-                reasoning: reason.clone(),
+            // Re-marking with the same status, source and reason is a no-op;
+            // don't rewrite the file (or bump the version) for it.
+            let unchanged = entry.status.as_ref().is_some_and(|current| {
+                current.value == status && current.source == source && current.reasoning == reason
             });
+            if !unchanged {
+                entry.status = Some(Attributed {
+                    value: status.clone(),
+                    source,
+                    reasoning: reason.clone(),
+                });
+                changed = true;
+            }
         }
-        true
+        changed
     })?;
 
     let verb = status_verb(&status);
@@ -433,23 +482,25 @@ pub fn run_unmark(args: MarkArgs) -> Result<(), String> {
     let (ids, _unknown) = resolve_mark_targets(&comparison.key, &live_ids, &args.hunks)?;
 
     let result = mutate_review(&repo, &review.ref_name, &hunks, |state| {
+        let mut changed = state.total_diff_hunks != total_hunks;
         state.total_diff_hunks = total_hunks;
-        sync_classification(state, &classification);
+        changed |= sync_classification(state, &classification);
         for id in &ids {
             // Clear the status; drop the entry entirely if nothing else is
             // recorded on it, to keep the review file tidy.
             let drop_entry = match state.hunks.get_mut(id) {
-                Some(hunk_state) => {
+                Some(hunk_state) if hunk_state.status.is_some() => {
                     hunk_state.status = None;
+                    changed = true;
                     hunk_state.is_empty()
                 }
-                None => false,
+                _ => false,
             };
             if drop_entry {
                 state.hunks.remove(id);
             }
         }
-        true
+        changed
     })?;
 
     if args.json {
@@ -477,9 +528,11 @@ pub fn run_status(args: StatusArgs) -> Result<(), String> {
     let view = load_review_view(&repo, args.target.spec.as_deref())?;
 
     let mut counts = Counts::default();
+    let trust = view.state.trust_set();
     for hunk in &view.hunks {
-        let labels = hunk_labels(&hunk.id, &view.state, &view.classification);
-        counts.tally(effective_status(&hunk.id, &labels, &view.state));
+        let hunk_state = view.state.hunks.get(&hunk.id);
+        let labels = hunk_labels(&hunk.id, hunk_state, &view.classification);
+        counts.tally(effective_status(hunk_state, labels, &trust));
     }
     let total = view.hunks.len();
     let reviewed = counts.trusted + counts.approved + counts.rejected;
@@ -810,4 +863,51 @@ mod tests {
         assert!(validate_note_append("").is_err());
         assert!(validate_note_append("looks good").is_ok());
     }
+
+    /// Marks that change nothing — the same status, source and reason again,
+    /// or clearing a hunk that has no status — must not rewrite the review
+    /// file or bump its version.
+    #[test]
+    fn no_op_marks_leave_the_review_file_untouched() {
+        let _lock = crate::review::central::tests::ENV_LOCK.lock().unwrap();
+        let (_guard, _review_home, _unused) = crate::review::central::tests::setup_test();
+        let (dir, first, second) = super::super::tests::two_commit_repo();
+        let spec = format!("{first}..{second}");
+        let (review, _hunks, live_ids) = load_for_mutation(dir.path(), Some(&spec)).unwrap();
+        let args = || MarkArgs {
+            target: ReviewTarget {
+                repo: Some(dir.path().to_string_lossy().into_owned()),
+                spec: Some(spec.clone()),
+            },
+            hunks: live_ids.iter().cloned().collect(),
+            reason: Some("checked".to_owned()),
+            source: Some(SourceArg::Cli),
+            json: true,
+        };
+        let path = crate::review::central::get_repo_storage_dir(dir.path())
+            .unwrap()
+            .join("reviews")
+            .join(crate::review::central::json_file_name(&review.ref_name));
+        let snapshot = || {
+            let version = storage::load_review_state(dir.path(), &review.ref_name)
+                .unwrap()
+                .version;
+            (std::fs::read(&path).unwrap(), version)
+        };
+
+        run_mark(args(), HunkStatus::Approved).unwrap();
+        let approved = snapshot();
+        run_mark(args(), HunkStatus::Approved).unwrap();
+        assert_eq!(snapshot(), approved, "re-approving must not rewrite");
+
+        run_unmark(args()).unwrap();
+        let cleared = snapshot();
+        assert!(cleared.1 > approved.1, "the first unmark is a real change");
+        run_unmark(args()).unwrap();
+        assert_eq!(
+            snapshot(),
+            cleared,
+            "unmarking unmarked hunks must not rewrite"
+        );
+    }
 }
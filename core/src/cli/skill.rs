@@ -60,9 +60,14 @@ fn write_skill(
     let skill_dir = skills_root.join(name);
     let skill_file = skill_dir.join("SKILL.md");
 
-    let updating = skill_file.exists();
-    std::fs::create_dir_all(&skill_dir)
-        .map_err(|e| format!("Failed to create {}: {e}", skill_dir.display()))?;
+    // One lstat decides both questions: an existing SKILL.md means this is an
+    // update and its directory is already there, so `create_dir_all` (which
+    // stats each ancestor) only runs on a fresh install.
+    let updating = std::fs::symlink_metadata(&skill_file).is_ok();
+    if !updating {
+        std::fs::create_dir_all(&skill_dir)
+            .map_err(|e| format!("Failed to create {}: {e}", skill_dir.display()))?;
+    }
     std::fs::write(&skill_file, contents)
         .map_err(|e| format!("Failed to write {}: {e}", skill_file.display()))?;
 
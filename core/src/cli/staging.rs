@@ -4,6 +4,7 @@
 //! do not read or write review state, so they need no saved review.
 
 use std::collections::BTreeMap;
+use std::io::{self, Write};
 use std::path::PathBuf;
 
 use clap::Args;
@@ -15,7 +16,8 @@ use crate::sources::local_git::LocalGitSource;
 use crate::trust::matches_pattern;
 
 use super::common::{
-    classified_labels, hunk_line_stats, parse_hunk_target, print_json, render_hunk_diff, HunkTarget,
+    classified_labels, hunk_line_stats, parse_hunk_target, print_human, print_json,
+    render_hunk_diff, HunkTarget,
 };
 use super::get_repo_path;
 
@@ -91,7 +93,6 @@ struct StageResultJson {
 pub fn run_changes(args: ChangesArgs) -> Result<(), String> {
     let repo_path = get_repo_path(&args.repo)?;
     let source = LocalGitSource::new(PathBuf::from(&repo_path)).map_err(|e| e.to_string())?;
-    let status = source.get_status().map_err(|e| e.to_string())?;
 
     // `--staged` / `--unstaged` narrow the view; neither (or both) shows all.
     let only_staged = args.staged && !args.unstaged;
@@ -99,22 +100,55 @@ pub fn run_changes(args: ChangesArgs) -> Result<(), String> {
     let want_staged = !only_unstaged;
     let want_unstaged = !only_staged;
 
-    // Parallel vectors: each hunk and whether it is staged.
+    // Reject a bad pattern before spending any git calls.
+    let file_filter = match &args.file {
+        Some(glob) => {
+            Some(glob::Pattern::new(glob).map_err(|e| format!("Invalid --file pattern: {e}"))?)
+        }
+        None => None,
+    };
+
+    // One `git diff` per side instead of one per file — scales cleanly to
+    // large change sets. Status and the two diffs are independent git
+    // subprocesses, so run them side by side rather than back to back.
+    let (status, unstaged_diff, staged_diff) = std::thread::scope(|scope| {
+        let status = scope.spawn(|| source.get_status());
+        let unstaged = want_unstaged.then(|| scope.spawn(|| source.get_unstaged_diff()));
+        let staged = want_staged.then(|| scope.spawn(|| source.get_staged_diff()));
+        (
+            status.join(),
+            unstaged.map(|handle| handle.join()),
+            staged.map(|handle| handle.join()),
+        )
+    });
+    let status = joined(status)?;
+
+    // The path and ID filters don't depend on classification, so apply them
+    // while collecting: hunks they exclude are never kept or classified.
+    // (`classify_hunks_static` labels each hunk on its own, never by looking
+    // at its neighbours, so classifying the survivors alone gives the same
+    // labels.)
+    let wanted = |hunk: &DiffHunk| {
+        file_filter
+            .as_ref()
+            .is_none_or(|pattern| pattern.matches(&hunk.file_path))
+            && args.hunk.as_ref().is_none_or(|id| &hunk.id == id)
+    };
+
+    // Parallel vectors: each kept hunk and whether it is staged.
     let mut hunks: Vec<DiffHunk> = Vec::new();
     let mut staged_flags: Vec<bool> = Vec::new();
 
-    // One `git diff` per side instead of one per file — scales cleanly to
-    // large change sets.
-    if want_unstaged {
-        let diff = source.get_unstaged_diff().map_err(|e| e.to_string())?;
-        for hunk in parse_multi_file_diff(&diff) {
+    if let Some(diff) = unstaged_diff {
+        let diff = joined(diff)?;
+        for hunk in parse_multi_file_diff(&diff).into_iter().filter(wanted) {
             hunks.push(hunk);
             staged_flags.push(false);
         }
     }
-    if want_staged {
-        let diff = source.get_staged_diff().map_err(|e| e.to_string())?;
-        for hunk in parse_multi_file_diff(&diff) {
+    if let Some(diff) = staged_diff {
+        let diff = joined(diff)?;
+        for hunk in parse_multi_file_diff(&diff).into_iter().filter(wanted) {
             hunks.push(hunk);
             staged_flags.push(true);
         }
@@ -122,25 +156,8 @@ pub fn run_changes(args: ChangesArgs) -> Result<(), String> {
 
     let classification = classify_hunks_static(&hunks);
 
-    let file_filter = match &args.file {
-        Some(glob) => {
-            Some(glob::Pattern::new(glob).map_err(|e| format!("Invalid --file pattern: {e}"))?)
-        }
-        None => None,
-    };
-
     let mut rows: Vec<ChangeRow> = Vec::new();
     for (hunk, staged) in hunks.iter().zip(&staged_flags) {
-        if let Some(pattern) = &file_filter {
-            if !pattern.matches(&hunk.file_path) {
-                continue;
-            }
-        }
-        if let Some(id) = &args.hunk {
-            if &hunk.id != id {
-                continue;
-            }
-        }
         let labels = classified_labels(&classification, &hunk.id);
         if let Some(label_pattern) = &args.label {
             if !labels.iter().any(|l| matches_pattern(l, label_pattern)) {
@@ -155,7 +172,7 @@ pub fn run_changes(args: ChangesArgs) -> Result<(), String> {
             untracked: false,
             additions,
             deletions,
-            labels,
+            labels: labels.to_vec(),
             // A single-hunk query always includes the diff.
             diff: if args.diff || args.hunk.is_some() {
                 Some(render_hunk_diff(hunk))
@@ -201,30 +218,47 @@ pub fn run_changes(args: ChangesArgs) -> Result<(), String> {
             hunks: rows,
         });
     } else {
-        print_changes_human(&rows);
+        print_human(|out| print_changes_human(out, &rows));
     }
     Ok(())
 }
 
-fn print_changes_human(rows: &[ChangeRow]) {
+/// Unwrap the result of a git call run on a scoped thread.
+fn joined<T, E: std::fmt::Display>(result: std::thread::Result<Result<T, E>>) -> Result<T, String> {
+    result
+        .map_err(|_| "git worker thread panicked".to_owned())?
+        .map_err(|e| e.to_string())
+}
+
+fn print_changes_human(out: &mut dyn Write, rows: &[ChangeRow]) -> io::Result<()> {
     if rows.is_empty() {
-        println!("No uncommitted changes.");
-        return;
+        writeln!(out, "No uncommitted changes.")?;
+        return Ok(());
     }
 
-    let staged = rows.iter().filter(|r| r.staged).count();
-    let unstaged = rows.iter().filter(|r| !r.staged && !r.untracked).count();
-    let untracked = rows.iter().filter(|r| r.untracked).count();
-    println!("working tree — {staged} staged, {unstaged} unstaged, {untracked} untracked\n");
+    let (mut staged, mut unstaged, mut untracked) = (0, 0, 0);
+    for row in rows {
+        if row.staged {
+            staged += 1;
+        } else if row.untracked {
+            untracked += 1;
+        } else {
+            unstaged += 1;
+        }
+    }
+    writeln!(
+        out,
+        "working tree — {staged} staged, {unstaged} unstaged, {untracked} untracked\n"
+    )?;
 
     let mut current_file = "";
     for row in rows {
         if row.file.as_str() != current_file {
-            println!("{}", row.file);
+            writeln!(out, "{}", row.file)?;
             current_file = row.file.as_str();
         }
         if row.untracked {
-            println!("  untracked  (whole file)");
+            writeln!(out, "  untracked  (whole file)")?;
         } else {
             let state = if row.staged { "staged  " } else { "unstaged" };
             let labels = if row.labels.is_empty() {
@@ -232,19 +266,21 @@ fn print_changes_human(rows: &[ChangeRow]) {
             } else {
                 format!("  {}", row.labels.join(","))
             };
-            println!(
+            writeln!(
+                out,
                 "  {}  {}  +{} -{}{}",
                 state, row.id, row.additions, row.deletions, labels
-            );
+            )?;
         }
         if let Some(diff) = &row.diff {
             for line in diff.lines() {
-                println!("      {line}");
+                writeln!(out, "      {line}")?;
             }
         }
     }
-    println!("\nStage:   review stage <hunk-id|file>...");
-    println!("Unstage: review unstage <hunk-id|file>...");
+    writeln!(out, "\nStage:   review stage <hunk-id|file>...")?;
+    writeln!(out, "Unstage: review unstage <hunk-id|file>...")?;
+    Ok(())
 }
 
 /// Record the same failure against every hash in `hashes`, e.g.
@@ -2,7 +2,8 @@
 //!
 //! Caches `Vec<DiffHunk>` keyed by the SHA-256 hash of the full diff
 //! output. If the diff hasn't changed, the cached hunks are returned
-//! directly, skipping diff parsing entirely.
+//! directly, skipping diff parsing entirely. The most recent entries are also
+//! kept in memory, so a long-running process skips re-reading the file too.
 
 use super::parser::DiffHunk;
 use crate::review::central;
@@ -12,6 +13,7 @@ use sha2::{Digest, Sha256};
 use std::fs;
 use std::io::BufWriter;
 use std::path::{Path, PathBuf};
+use std::sync::Mutex;
 
 type Result<T> = std::result::Result<T, Box<dyn std::error::Error>>;
 
@@ -19,6 +21,22 @@ type Result<T> = std::result::Result<T, Box<dyn std::error::Error>>;
 /// stale caches.
 const CACHE_VERSION: u32 = 1;
 
+/// How many comparisons' hunks [`RECENT`] keeps.
+const RECENT_CAPACITY: usize = 4;
+
+/// Hunks recently loaded from or saved to the disk cache, most recent first,
+/// as `(cache file path, diff hash, hunks)`. The desktop app re-enumerates a
+/// comparison's hunks on every watcher event; while the diff is unchanged this
+/// answers without reading and deserializing the cache file again.
+static RECENT: Mutex<Vec<(PathBuf, String, Vec<DiffHunk>)>> = Mutex::new(Vec::new());
+
+fn remember(path: PathBuf, diff_hash: &str, hunks: Vec<DiffHunk>) {
+    let mut recent = RECENT.lock().expect("RECENT poisoned");
+    recent.retain(|(cached_path, ..)| *cached_path != path);
+    recent.insert(0, (path, diff_hash.to_owned(), hunks));
+    recent.truncate(RECENT_CAPACITY);
+}
+
 #[derive(Serialize, Deserialize)]
 struct HunkCache {
     #[serde(default)]
@@ -37,7 +55,7 @@ pub fn compute_hash(input: &str) -> String {
 /// Return the cache file path for a given repo + comparison.
 fn cache_path(repo_path: &Path, comparison: &Comparison) -> Result<PathBuf> {
     let cache_dir = central::get_repo_cache_dir(repo_path)?;
-    let filename = format!("{}.json", central::sanitize_path_component(&comparison.key));
+    let filename = central::json_file_name(&comparison.key);
     Ok(cache_dir.join("hunk-cache").join(filename))
 }
 
@@ -50,12 +68,24 @@ pub fn load(
     current_diff_hash: &str,
 ) -> Result<Option<Vec<DiffHunk>>> {
     let path = cache_path(repo_path, comparison)?;
-    if !path.exists() {
-        return Ok(None);
+    if let Some((_, diff_hash, hunks)) = RECENT
+        .lock()
+        .expect("RECENT poisoned")
+        .iter()
+        .find(|(cached_path, ..)| *cached_path == path)
+    {
+        if diff_hash == current_diff_hash {
+            return Ok(Some(hunks.clone()));
+        }
     }
-    let content = fs::read_to_string(&path)?;
+    let content = match fs::read_to_string(&path) {
+        Ok(content) => content,
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(None),
+        Err(e) => return Err(e.into()),
+    };
     let cached: HunkCache = serde_json::from_str(&content)?;
     if cached.version == CACHE_VERSION && cached.diff_hash == current_diff_hash {
+        remember(path, current_diff_hash, cached.hunks.clone());
         Ok(Some(cached.hunks))
     } else {
         Ok(None)
@@ -88,5 +118,6 @@ pub fn save(
     };
     let file = fs::File::create(&path)?;
     serde_json::to_writer(BufWriter::new(file), &cache)?;
+    remember(path, diff_hash, hunks.to_vec());
     Ok(())
 }
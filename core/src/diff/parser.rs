@@ -142,23 +142,36 @@ pub fn parse_diff(diff_output: &str, file_path: &str) -> Vec<DiffHunk> {
 
 /// Parse a combined multi-file git diff output into hunks.
 /// Splits on "diff --git" boundaries, extracts the file path from "+++ b/" lines,
-/// and delegates each section to `parse_diff`.
+/// and delegates each section to `parse_diff`. Sections are handed over as
+/// slices of `diff_output` rather than copied out line by line — `parse_diff`
+/// already ignores the `---`/`+++`/`Binary files` header lines they contain.
 pub fn parse_multi_file_diff(diff_output: &str) -> Vec<DiffHunk> {
     let mut hunks = Vec::new();
-    let mut current_section = String::new();
+    // Byte offset where the current file's section starts (just past its
+    // "diff --git" line).
+    let mut section_start = 0;
     let mut current_file: Option<String> = None;
     // Track the old-side path from "--- a/..." for deleted files
     let mut old_file: Option<String> = None;
 
-    for line in diff_output.lines() {
+    let mut pos = 0;
+    for raw in diff_output.split_inclusive('\n') {
+        let line_start = pos;
+        pos += raw.len();
+        // Same line splitting as `str::lines`: drop "\n" and a preceding "\r".
+        let line = raw
+            .strip_suffix('\n')
+            .map_or(raw, |l| l.strip_suffix('\r').unwrap_or(l));
+
         if line.starts_with("diff --git ") {
             // Flush previous section
             if let Some(ref file_path) = current_file {
-                if !current_section.is_empty() {
-                    hunks.extend(parse_diff(&current_section, file_path));
-                }
+                hunks.extend(parse_diff(
+                    &diff_output[section_start..line_start],
+                    file_path,
+                ));
             }
-            current_section.clear();
+            section_start = pos;
             current_file = None;
             old_file = None;
         } else if let Some(path) = line.strip_prefix("--- a/") {
@@ -172,20 +185,15 @@ pub fn parse_multi_file_diff(diff_output: &str) -> Vec<DiffHunk> {
             // Binary diffs have no @@ headers, so create a synthetic hunk.
             if let Some(path) = parse_binary_diff_path(line) {
                 hunks.push(create_binary_hunk(&path));
-                // Prevent the flush logic from re-processing this section
+                // The section has no @@ lines, so flushing it adds nothing more.
                 current_file = Some(path);
             }
-        } else {
-            current_section.push_str(line);
-            current_section.push('\n');
         }
     }
 
     // Flush last section
     if let Some(ref file_path) = current_file {
-        if !current_section.is_empty() {
-            hunks.extend(parse_diff(&current_section, file_path));
-        }
+        hunks.extend(parse_diff(&diff_output[section_start..], file_path));
     }
 
     hunks
@@ -343,6 +351,14 @@ pub fn compute_content_hash(bytes: &[u8]) -> String {
     hex::encode(&hasher.finalize()[..8])
 }
 
+/// [`compute_content_hash`] over everything `reader` yields, without holding
+/// it all in memory.
+pub fn compute_reader_content_hash(reader: &mut impl std::io::Read) -> std::io::Result<String> {
+    let mut hasher = Sha256::new();
+    std::io::copy(reader, &mut hasher)?;
+    Ok(hex::encode(&hasher.finalize()[..8]))
+}
+
 /// Create a hunk for an untracked (new) file.
 /// The `content_hash` should be a hash of the file's actual content so that
 /// modifications to the file produce different hunk IDs (invalidating approvals).
@@ -805,6 +821,20 @@ diff --git a/bar.rs b/bar.rs
         assert_eq!(hunks[1].old_start, 5);
     }
 
+    #[test]
+    fn test_parse_multi_file_diff_crlf_matches_single_file_parse() {
+        let section = "@@ -1,2 +1,2 @@\r\n context\r\n-old\r\n+new\r\n";
+        let diff = format!(
+            "diff --git a/a.txt b/a.txt\r\nindex 1..2 100644\r\n--- a/a.txt\r\n+++ b/a.txt\r\n{section}"
+        );
+        let multi = parse_multi_file_diff(&diff);
+        let single = parse_diff(section, "a.txt");
+        assert_eq!(multi.len(), 1);
+        assert_eq!(multi[0].id, single[0].id);
+        assert_eq!(multi[0].lines.len(), 3);
+        assert_eq!(multi[0].lines[2].content, "new");
+    }
+
     #[test]
     fn test_parse_multi_file_diff_deleted_file() {
         // Deleted files have "+++ /dev/null" — hunks should use the "--- a/" path
@@ -953,4 +983,11 @@ Binary files a/old.png and /dev/null differ";
         assert_eq!(hunks.len(), 1);
         assert_eq!(hunks[0].file_path, "old.png");
     }
+
+    #[test]
+    fn test_reader_content_hash_matches_byte_hash() {
+        let bytes = "line one\nline two\n".repeat(10_000).into_bytes();
+        let streamed = compute_reader_content_hash(&mut bytes.as_slice()).unwrap();
+        assert_eq!(streamed, compute_content_hash(&bytes));
+    }
 }
@@ -58,10 +58,34 @@ pub struct RepoIndex {
     pub repos: HashMap<String, RepoIndexEntry>,
 }
 
+/// Characters that are problematic in file paths, replaced with `_`.
+const UNSAFE_PATH_CHARS: [char; 9] = ['/', '\\', ':', '*', '?', '"', '<', '>', '|'];
+
 /// Sanitize a string for use as a filename or directory name.
 /// Replaces characters that are problematic in file paths: `/\:*?"<>|` → `_`.
 pub fn sanitize_path_component(name: &str) -> String {
-    name.replace(['/', '\\', ':', '*', '?', '"', '<', '>', '|'], "_")
+    name.replace(UNSAFE_PATH_CHARS, "_")
+}
+
+/// [`sanitize_path_component`] for a single character.
+fn sanitize_char(c: char) -> char {
+    if UNSAFE_PATH_CHARS.contains(&c) {
+        '_'
+    } else {
+        c
+    }
+}
+
+/// Build the `<sanitized name>.json` file name used by the per-comparison
+/// stores (review files, hunk and symbol caches).
+///
+/// Sanitizes straight into a buffer sized for the suffix, so the name is
+/// built with a single allocation instead of a sanitize-then-`format!` pair.
+pub fn json_file_name(name: &str) -> String {
+    let mut file_name = String::with_capacity(name.len() + ".json".len());
+    file_name.extend(name.chars().map(sanitize_char));
+    file_name.push_str(".json");
+    file_name
 }
 
 /// Return the central storage root.
@@ -92,24 +116,27 @@ fn canonical_path(repo_path: &Path) -> PathBuf {
 /// need worktree-aware identity or fingerprints (`compute_repo_id`,
 /// `service::activity_cache`) build on it.
 pub(crate) fn resolve_git_dirs(repo_path: &Path) -> (PathBuf, PathBuf) {
+    try_resolve_git_dirs(repo_path).unwrap_or_else(|| {
+        let git_path = repo_path.join(".git");
+        (git_path.clone(), git_path)
+    })
+}
+
+/// [`resolve_git_dirs`] without the fallback: `None` when `<repo>/.git` is
+/// missing or is a file whose `gitdir:` pointer can't be read, so callers can
+/// tell a real resolution from the `<repo>/.git` stand-in.
+fn try_resolve_git_dirs(repo_path: &Path) -> Option<(PathBuf, PathBuf)> {
     let git_path = repo_path.join(".git");
-    let Ok(meta) = fs::metadata(&git_path) else {
-        return (git_path.clone(), git_path);
-    };
+    let meta = fs::metadata(&git_path).ok()?;
     if meta.is_dir() {
-        return (git_path.clone(), git_path);
+        return Some((git_path.clone(), git_path));
     }
     // `.git` is a file — parse the `gitdir: ...` pointer.
-    let Ok(content) = fs::read_to_string(&git_path) else {
-        return (git_path.clone(), git_path);
-    };
-    let Some(gitdir_raw) = content
+    let content = fs::read_to_string(&git_path).ok()?;
+    let gitdir_raw = content
         .lines()
         .next()
-        .and_then(|l| l.strip_prefix("gitdir: "))
-    else {
-        return (git_path.clone(), git_path);
-    };
+        .and_then(|l| l.strip_prefix("gitdir: "))?;
     let gitdir = {
         let p = Path::new(gitdir_raw.trim());
         if p.is_absolute() {
@@ -131,7 +158,7 @@ pub(crate) fn resolve_git_dirs(repo_path: &Path) -> (PathBuf, PathBuf) {
         }
         Err(_) => gitdir.clone(),
     };
-    (gitdir, common_dir)
+    Some((gitdir, common_dir))
 }
 
 /// The main working tree for a repo, given any path inside it (including a
@@ -153,22 +180,57 @@ pub fn repo_root(repo_path: &Path) -> PathBuf {
 /// The ID hashes the canonical git **common dir** rather than the working path,
 /// so a repository and all of its worktrees resolve to the same ID (and share
 /// one review store). Non-git paths fall back to hashing `<path>/.git`.
+///
+/// Every storage path (review state, caches, worktrees) derives from this ID,
+/// so it is memoized per input path for the life of the process: resolving it
+/// costs a `.git` stat/read plus a `canonicalize` on each call.
 pub fn compute_repo_id(repo_path: &Path) -> Result<String, CentralError> {
-    let (_git_dir, common_dir) = resolve_git_dirs(repo_path);
-    let canonical = canonical_path(&common_dir);
+    if let Some(id) = REPO_ID_CACHE
+        .read()
+        .expect("REPO_ID_CACHE poisoned")
+        .get(repo_path)
+    {
+        return Ok(id.clone());
+    }
+
+    // Only a resolved git dir is cached. The `<repo>/.git` fallback may exist
+    // (a worktree's `.git` file whose pointer couldn't be read this time) and
+    // still be the wrong identity, and a path that isn't a repo yet hashes its
+    // uncanonicalized `.git`, which changes once it becomes one.
+    let (common_dir, resolved) = match try_resolve_git_dirs(repo_path) {
+        Some((_git_dir, common_dir)) => (common_dir, true),
+        None => (repo_path.join(".git"), false),
+    };
+    let canonical = common_dir.canonicalize();
+    let resolved = resolved && canonical.is_ok();
+    let canonical = canonical.unwrap_or(common_dir);
     let mut hasher = Sha256::new();
     hasher.update(canonical.to_string_lossy().as_bytes());
     let result = hasher.finalize();
-    Ok(hex::encode(&result[..8])) // 8 bytes = 16 hex chars
+    let id = hex::encode(&result[..8]); // 8 bytes = 16 hex chars
+
+    if resolved {
+        REPO_ID_CACHE
+            .write()
+            .expect("REPO_ID_CACHE poisoned")
+            .insert(repo_path.to_path_buf(), id.clone());
+    }
+    Ok(id)
 }
 
+/// Repo IDs already computed this process, keyed by the path they were asked
+/// for. See [`compute_repo_id`].
+static REPO_ID_CACHE: LazyLock<RwLock<HashMap<PathBuf, String>>> =
+    LazyLock::new(|| RwLock::new(HashMap::new()));
+
 /// Get the **durable** storage directory for a specific repo
 /// (`~/.review/repos/<repo-id>/`): review state and `repo.json`. This is the
 /// precious tier — never delete it to reclaim space.
 pub fn get_repo_storage_dir(repo_path: &Path) -> Result<PathBuf, CentralError> {
-    let root = get_central_root()?;
-    let repo_id = compute_repo_id(repo_path)?;
-    Ok(root.join("repos").join(repo_id))
+    let mut dir = get_central_root()?;
+    dir.push("repos");
+    dir.push(compute_repo_id(repo_path)?);
+    Ok(dir)
 }
 
 /// Get the **disposable** cache directory for a specific repo
@@ -177,9 +239,10 @@ pub fn get_repo_storage_dir(repo_path: &Path) -> Result<PathBuf, CentralError> {
 /// touches durable review state. Kept separate from `get_repo_storage_dir` so
 /// the two tiers can be cleared independently.
 pub fn get_repo_cache_dir(repo_path: &Path) -> Result<PathBuf, CentralError> {
-    let root = get_central_root()?;
-    let repo_id = compute_repo_id(repo_path)?;
-    Ok(root.join("cache").join(repo_id))
+    let mut dir = get_central_root()?;
+    dir.push("cache");
+    dir.push(compute_repo_id(repo_path)?);
+    Ok(dir)
 }
 
 /// Get the base directory for review-managed worktrees for a given repo.
@@ -237,11 +300,10 @@ fn load_index() -> Result<RepoIndex, CentralError> {
     }
 
     let index_path = root.join("index.json");
-    let mut index: RepoIndex = if !index_path.exists() {
-        RepoIndex::default()
-    } else {
-        let content = fs::read_to_string(&index_path)?;
-        serde_json::from_str(&content)?
+    let mut index: RepoIndex = match fs::read_to_string(&index_path) {
+        Ok(content) => serde_json::from_str(&content)?,
+        Err(e) if e.kind() == io::ErrorKind::NotFound => RepoIndex::default(),
+        Err(e) => return Err(e.into()),
     };
     // Heal-on-read, mirroring review-file migration: prune stale duplicates
     // and persist so it only happens once. A failed write still leaves the
@@ -426,6 +488,28 @@ pub(crate) mod tests {
         assert_eq!(repo_root(main.path()), main.path().canonicalize().unwrap());
     }
 
+    #[test]
+    fn test_unreadable_worktree_pointer_is_not_cached() {
+        let main = TempDir::new().unwrap();
+        let wt_gitdir = main.path().join(".git").join("worktrees").join("wt");
+        fs::create_dir_all(&wt_gitdir).unwrap();
+        fs::write(wt_gitdir.join("commondir"), "../..\n").unwrap();
+
+        // The worktree's `.git` file exists but its pointer can't be parsed
+        // (caught mid-write, say): the ID falls back to the file itself.
+        let worktree = TempDir::new().unwrap();
+        let pointer = worktree.path().join(".git");
+        fs::write(&pointer, "").unwrap();
+        let fallback_id = compute_repo_id(worktree.path()).unwrap();
+
+        // Once the pointer reads, the worktree joins the main repo's store
+        // rather than staying pinned to the fallback.
+        fs::write(&pointer, format!("gitdir: {}\n", wt_gitdir.display())).unwrap();
+        let wt_id = compute_repo_id(worktree.path()).unwrap();
+        assert_ne!(wt_id, fallback_id);
+        assert_eq!(wt_id, compute_repo_id(main.path()).unwrap());
+    }
+
     #[test]
     fn test_prune_duplicate_paths_keeps_latest_accessed() {
         let mut index = RepoIndex::default();
@@ -523,4 +607,15 @@ pub(crate) mod tests {
         assert_eq!(sanitize_path_component("simple-name"), "simple-name");
         assert_eq!(sanitize_path_component("main..feature"), "main..feature");
     }
+
+    #[test]
+    fn test_json_file_name() {
+        assert_eq!(json_file_name("main..feature/x"), "main..feature_x.json");
+        for name in ["feature/x", r#"a\b:c*d?"e<f>g|h"#] {
+            assert_eq!(
+                json_file_name(name),
+                format!("{}.json", sanitize_path_component(name))
+            );
+        }
+    }
 }
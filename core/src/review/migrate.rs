@@ -86,7 +86,12 @@ pub fn migrate(mut value: Value) -> Result<Value, MigrateError> {
         });
     }
 
-    // `found <= REVIEW_SCHEMA_VERSION` here, so the cast and slice are in range.
+    if found == REVIEW_SCHEMA_VERSION as u64 {
+        // Already current: no steps to run and the version is already stamped.
+        return Ok(value);
+    }
+
+    // `found < REVIEW_SCHEMA_VERSION` here, so the cast and slice are in range.
     for step in &STEPS[found as usize..REVIEW_SCHEMA_VERSION as usize] {
         step(&mut value)?;
     }
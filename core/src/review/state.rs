@@ -1,6 +1,6 @@
 use crate::diff::parser::DiffHunk;
-use crate::trust::matches_pattern;
 use crate::trust::patterns::get_all_pattern_ids;
+use crate::trust::TrustSet;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 
@@ -283,7 +283,7 @@ impl HunkState {
     }
 }
 
-#[derive(Debug, Clone, Serialize, Deserialize)]
+#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
 #[serde(rename_all = "lowercase")]
 pub enum HunkStatus {
     Approved,
@@ -357,25 +357,28 @@ impl ReviewState {
     /// a stable key; older entries (pre-`stable_key`) that orphan are dropped or
     /// retained per `drop_orphans`, exactly as any other orphan.
     pub fn reconcile(&mut self, live_hunks: &[DiffHunk], drop_orphans: bool) -> Reconciliation {
-        // One stable hash per live hunk, computed once and reused throughout.
-        let stable_by_id: HashMap<&str, String> = live_hunks
-            .iter()
-            .map(|hunk| (hunk.id.as_str(), hunk.stable_hash()))
-            .collect();
-
-        // Candidate carry-forward targets: live hunks that don't already have an
-        // entry, mapped stable key -> hunk id. A key shared by >1 such hunk is
-        // ambiguous and disqualified (`None`) so a decision is never
-        // mis-attributed.
+        // Nothing recorded means nothing to re-associate — skip hashing the diff.
+        if self.hunks.is_empty() {
+            return Reconciliation::default();
+        }
+
+        // A single pass over the live diff builds both lookups:
+        // - one stable hash per live hunk, computed once and reused throughout;
+        // - candidate carry-forward targets: live hunks that don't already have
+        //   an entry, mapped stable key -> hunk id. A key shared by >1 such hunk
+        //   is ambiguous and disqualified (`None`) so a decision is never
+        //   mis-attributed.
+        let mut stable_by_id: HashMap<&str, String> = HashMap::with_capacity(live_hunks.len());
         let mut targets: HashMap<String, Option<String>> = HashMap::new();
         for hunk in live_hunks {
-            if self.hunks.contains_key(&hunk.id) {
-                continue;
+            let stable = hunk.stable_hash();
+            if !self.hunks.contains_key(&hunk.id) {
+                targets
+                    .entry(stable.clone())
+                    .and_modify(|slot| *slot = None)
+                    .or_insert_with(|| Some(hunk.id.clone()));
             }
-            targets
-                .entry(stable_by_id[hunk.id.as_str()].clone())
-                .and_modify(|slot| *slot = None)
-                .or_insert_with(|| Some(hunk.id.clone()));
+            stable_by_id.insert(hunk.id.as_str(), stable);
         }
 
         let mut result = Reconciliation::default();
@@ -415,13 +418,9 @@ impl ReviewState {
         result
     }
 
-    /// Whether any of `labels` matches a pattern in the trust list.
-    pub fn labels_trusted(&self, labels: &[String]) -> bool {
-        labels.iter().any(|label| {
-            self.trust_list
-                .iter()
-                .any(|pattern| matches_pattern(label, pattern))
-        })
+    /// The trust list prepared for matching many hunks' labels in one pass.
+    pub fn trust_set(&self) -> TrustSet<'_> {
+        TrustSet::new(&self.trust_list)
     }
 
     /// Create a summary of this review state
@@ -433,6 +432,7 @@ impl ReviewState {
         let mut rejected_hunks = 0usize;
         let mut saved_for_later_hunks = 0usize;
         let mut trusted_hunks = 0usize;
+        let trust = self.trust_set();
 
         for h in self.hunks.values() {
             match h.status.as_ref().map(|s| &s.value) {
@@ -442,7 +442,7 @@ impl ReviewState {
                 None => {
                     // Hunks with no explicit status count as reviewed when a
                     // label matches the trust list.
-                    if self.labels_trusted(h.labels()) {
+                    if trust.matches_any(h.labels()) {
                         trusted_hunks += 1;
                     }
                 }
@@ -506,40 +506,34 @@ pub(crate) fn iso8601_from_system_time(time: std::time::SystemTime) -> String {
     let minutes = (remaining % 3600) / 60;
     let seconds = remaining % 60;
 
-    // Calculate year, month, day from days since epoch (1970-01-01)
-    let mut year = 1970i32;
-    let mut remaining_days = days as i32;
-
-    loop {
-        let days_in_year = if is_leap_year(year) { 366 } else { 365 };
-        if remaining_days < days_in_year {
-            break;
-        }
-        remaining_days -= days_in_year;
-        year += 1;
-    }
-
-    let days_in_months: [i32; 12] = if is_leap_year(year) {
-        [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-    } else {
-        [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-    };
-
-    let mut month = 1;
-    for days_in_month in &days_in_months {
-        if remaining_days < *days_in_month {
-            break;
-        }
-        remaining_days -= *days_in_month;
-        month += 1;
-    }
-    let day = remaining_days + 1;
+    let (year, month, day) = civil_date(days);
 
     format!("{year:04}-{month:02}-{day:02}T{hours:02}:{minutes:02}:{seconds:02}.{millis:03}Z")
 }
 
-fn is_leap_year(year: i32) -> bool {
-    (year % 4 == 0 && year % 100 != 0) || (year % 400 == 0)
+/// Calendar `(year, month, day)` for a count of days since 1970-01-01.
+///
+/// Howard Hinnant's `civil_from_days`: counts in 400-year eras starting on
+/// March 1st, so leap days fall at the end of each year and the date comes
+/// out in closed form rather than by walking years and months.
+fn civil_date(days: u64) -> (i32, i32, i32) {
+    let z = days as i64 + 719_468;
+    let era = z / 146_097;
+    // Day in [0, 146096], year in [0, 399] and day of year in [0, 365], all
+    // within the era; month in [0, 11] counting from March.
+    let day_of_era = z - era * 146_097;
+    let year_of_era =
+        (day_of_era - day_of_era / 1460 + day_of_era / 36_524 - day_of_era / 146_096) / 365;
+    let day_of_year = day_of_era - (365 * year_of_era + year_of_era / 4 - year_of_era / 100);
+    let march_month = (5 * day_of_year + 2) / 153;
+    let day = day_of_year - (153 * march_month + 2) / 5 + 1;
+    let month = if march_month < 10 {
+        march_month + 3
+    } else {
+        march_month - 9
+    };
+    let year = year_of_era + era * 400 + i64::from(month <= 2);
+    (year as i32, month as i32, day as i32)
 }
 
 /// Summary information about a saved review (for listing on start screen)
@@ -749,6 +743,20 @@ mod tests {
         assert!(timestamp.len() >= 24); // "2024-01-01T00:00:00.000Z"
     }
 
+    #[test]
+    fn test_iso8601_from_system_time_across_days() {
+        use std::time::{Duration, UNIX_EPOCH};
+        let at = |secs: u64| iso8601_from_system_time(UNIX_EPOCH + Duration::from_secs(secs));
+        assert_eq!(at(0), "1970-01-01T00:00:00.000Z");
+        assert_eq!(at(946_598_400), "1999-12-31T00:00:00.000Z");
+        // Leap days, including the 400-year one and a skipped century.
+        assert_eq!(at(951_782_400), "2000-02-29T00:00:00.000Z");
+        assert_eq!(at(1_709_164_800), "2024-02-29T00:00:00.000Z");
+        assert_eq!(at(1_709_164_800 + 86_399), "2024-02-29T23:59:59.000Z");
+        assert_eq!(at(1_709_251_200), "2024-03-01T00:00:00.000Z");
+        assert_eq!(at(4_107_542_400), "2100-03-01T00:00:00.000Z");
+    }
+
     // --- stable identity + carry-forward (reconcile) ---
 
     // Both diffs add the same line `NEW` to `f.txt`, but with different
@@ -1,12 +1,16 @@
 use super::central;
 use super::migrate;
-use super::state::{ReviewState, ReviewSummary};
+use super::state::{ReviewState, ReviewSummary, REVIEW_SCHEMA_VERSION};
 use crate::sources::github::GitHubPrRef;
 use crate::sources::local_git::DiffShortStat;
 use serde::Serialize;
+use std::collections::{HashMap, HashSet};
 use std::fs;
 use std::io;
 use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{LazyLock, Mutex};
+use std::time::SystemTime;
 use thiserror::Error;
 
 #[derive(Error, Debug)]
@@ -25,18 +29,42 @@ pub enum StorageError {
 
 /// Parse review JSON, migrating it forward to the current schema first.
 ///
-/// All review reads funnel through here so a stored file is never deserialized
-/// against the typed struct without going through migration — that is what
-/// turns a breaking format change into a migration instead of silent data loss.
-fn deserialize_review(content: &str) -> Result<ReviewState, StorageError> {
-    let raw: serde_json::Value = serde_json::from_str(content)?;
+/// All review reads funnel through here so a stored file is never accepted as
+/// the typed struct unless it is at the current schema or has been migrated
+/// there — that is what turns a breaking format change into a migration
+/// instead of silent data loss.
+///
+/// Takes the file's raw bytes: serde_json validates UTF-8 as it parses, so
+/// reading into a `String` first would only add a second pass over the file.
+fn deserialize_review(content: &[u8]) -> Result<ReviewState, StorageError> {
+    // Fast path: nearly every file on disk is already at the current schema,
+    // so deserialize straight into the typed struct and skip building a
+    // `Value` tree just to hand it back unchanged. Anything else — older,
+    // newer, or a shape the struct rejects — falls through to the migrating
+    // path, which either upgrades it or produces the proper error.
+    if let Ok(state) = serde_json::from_slice::<ReviewState>(content) {
+        if state.schema_version == REVIEW_SCHEMA_VERSION {
+            return Ok(state);
+        }
+    }
+    let raw: serde_json::Value = serde_json::from_slice(content)?;
     let migrated = migrate::migrate(raw)?;
     Ok(serde_json::from_value(migrated)?)
 }
 
 /// Get the storage directory for review state (centralized).
 fn get_storage_dir(repo_path: &Path) -> Result<PathBuf, StorageError> {
-    Ok(central::get_repo_storage_dir(repo_path)?.join("reviews"))
+    let mut dir = central::get_repo_storage_dir(repo_path)?;
+    dir.push("reviews");
+    Ok(dir)
+}
+
+/// Path of the review file for `ref_name`, built in place on the storage dir's
+/// buffer rather than through a chain of `join`s that each copy the path.
+fn review_path(repo_path: &Path, ref_name: &str) -> Result<PathBuf, StorageError> {
+    let mut path = get_storage_dir(repo_path)?;
+    path.push(review_filename(ref_name));
+    Ok(path)
 }
 
 /// Path to the repo's stored default-comparison marker (`review use`).
@@ -175,23 +203,134 @@ pub fn list_all_reviews_global() -> Result<Vec<GlobalReviewSummary>, StorageErro
 
 /// Generate a filename for a review keyed by its ref.
 fn review_filename(ref_name: &str) -> String {
-    format!("{}.json", central::sanitize_path_component(ref_name))
+    central::json_file_name(ref_name)
+}
+
+/// A file's modification time, length and inode, used to tell whether a cached
+/// parse of it is still current. Every save replaces the file by rename, so a
+/// rewrite that keeps the length within one mtime tick still gets a new inode.
+type FileStamp = (SystemTime, u64, u64);
+
+fn file_stamp(meta: &fs::Metadata) -> Option<FileStamp> {
+    Some((meta.modified().ok()?, meta.len(), file_id(meta)))
+}
+
+#[cfg(unix)]
+fn file_id(meta: &fs::Metadata) -> u64 {
+    std::os::unix::fs::MetadataExt::ino(meta)
+}
+
+#[cfg(not(unix))]
+fn file_id(_meta: &fs::Metadata) -> u64 {
+    0
+}
+
+/// Parsed reviews keyed by file path, each with the stamp of the file it was
+/// parsed from. The desktop app reloads a review on every watcher event and
+/// the CLI loads the same review several times per command; a hit costs one
+/// `stat` instead of a read and full parse. A write to the file — ours or
+/// another process's — moves its mtime (and usually its length), which retires
+/// the entry.
+static STATE_CACHE: LazyLock<Mutex<StateCache>> = LazyLock::new(Mutex::default);
+
+/// How many parsed reviews [`STATE_CACHE`] keeps. A long-running process (the
+/// desktop app, the server) can touch many reviews across repos; past this,
+/// the least recently used entry is dropped.
+const STATE_CACHE_CAPACITY: usize = 32;
+
+#[derive(Default)]
+struct StateCache {
+    entries: HashMap<PathBuf, CachedState>,
+    /// Monotonic use counter; an entry's `last_used` is the tick of its most
+    /// recent insert or hit.
+    tick: u64,
+}
+
+struct CachedState {
+    stamp: FileStamp,
+    state: ReviewState,
+    last_used: u64,
+}
+
+impl StateCache {
+    /// The cached state for `path`, if it was parsed from a file with `stamp`.
+    fn get(&mut self, path: &Path, stamp: FileStamp) -> Option<ReviewState> {
+        self.tick += 1;
+        let entry = self.entries.get_mut(path)?;
+        if entry.stamp != stamp {
+            return None;
+        }
+        entry.last_used = self.tick;
+        Some(entry.state.clone())
+    }
+
+    fn insert(&mut self, path: &Path, stamp: FileStamp, state: &ReviewState) {
+        self.tick += 1;
+        if self.entries.len() >= STATE_CACHE_CAPACITY && !self.entries.contains_key(path) {
+            // Linear scan: the cache is small and inserts only follow a parse
+            // or a save, both far costlier than this.
+            let oldest = self
+                .entries
+                .iter()
+                .min_by_key(|(_, entry)| entry.last_used)
+                .map(|(path, _)| path.clone());
+            if let Some(oldest) = oldest {
+                self.entries.remove(&oldest);
+            }
+        }
+        self.entries.insert(
+            path.to_path_buf(),
+            CachedState {
+                stamp,
+                state: state.clone(),
+                last_used: self.tick,
+            },
+        );
+    }
+
+    fn remove(&mut self, path: &Path) {
+        self.entries.remove(path);
+    }
+}
+
+fn cache_state(path: &Path, stamp: FileStamp, state: &ReviewState) {
+    STATE_CACHE
+        .lock()
+        .expect("STATE_CACHE poisoned")
+        .insert(path, stamp, state);
 }
 
 /// Load review state for a ref.
 pub fn load_review_state(repo_path: &Path, ref_name: &str) -> Result<ReviewState, StorageError> {
-    let storage_dir = get_storage_dir(repo_path)?;
-    let filename = review_filename(ref_name);
-    let path = storage_dir.join(&filename);
+    let path = review_path(repo_path, ref_name)?;
 
-    if path.exists() {
-        let content = fs::read_to_string(&path)?;
-        let state = deserialize_review(&content)?;
-        Ok(state)
-    } else {
+    let meta = match fs::metadata(&path) {
+        Ok(meta) => meta,
         // Return a new empty state (not persisted — call ensure_review_exists for that)
-        Ok(ReviewState::new(ref_name, None))
+        Err(e) if e.kind() == io::ErrorKind::NotFound => {
+            return Ok(ReviewState::new(ref_name, None));
+        }
+        Err(e) => return Err(e.into()),
+    };
+    let stamp = file_stamp(&meta);
+    if let Some(stamp) = stamp {
+        let cached = STATE_CACHE
+            .lock()
+            .expect("STATE_CACHE poisoned")
+            .get(&path, stamp);
+        if let Some(state) = cached {
+            return Ok(state);
+        }
     }
+
+    let content = fs::read(&path)?;
+    let state = deserialize_review(&content)?;
+    // Stamped before the read: if the file changed in between, the next load
+    // sees a newer stamp and re-reads rather than trusting this entry.
+    if let Some(stamp) = stamp {
+        cache_state(&path, stamp, &state);
+    }
+    Ok(state)
 }
 
 /// Save review state with optimistic concurrency control.
@@ -208,24 +347,27 @@ pub fn load_review_state(repo_path: &Path, ref_name: &str) -> Result<ReviewState
 /// could never stick. Adoption belongs to the explicit paths:
 /// [`ensure_review_exists`] and `central::register_repo_if_valid`.
 pub fn save_review_state(repo_path: &Path, state: &ReviewState) -> Result<(), StorageError> {
-    let storage_dir = get_storage_dir(repo_path)?;
-    fs::create_dir_all(&storage_dir)?;
-
-    let filename = review_filename(&state.ref_name);
-    let path = storage_dir.join(&filename);
+    let path = review_path(repo_path, &state.ref_name)?;
 
     // Check for version conflict if the file exists.
-    if path.exists() {
-        let existing_content = fs::read_to_string(&path)?;
+    let existing_content = read_if_exists(&path)?;
+    if let Some(existing_content) = &existing_content {
         // An existing file we can't read is a hard conflict, never silently
         // overwritten: it may be a newer schema or genuinely corrupt, and
         // clobbering it would be the data loss the loud-load path prevents.
-        let existing_state = deserialize_review(&existing_content)?;
+        let existing_state = deserialize_review(existing_content)?;
         // version 0 means a fresh save (no conflict check needed); otherwise the
         // expected on-disk version is state.version - 1.
         if state.version > 0 {
             let expected_disk_version = state.version - 1;
             if existing_state.version != expected_disk_version {
+                // The caller will reload and retry; make sure that reload
+                // reads the file even if a coarse-mtime filesystem left the
+                // stamp unchanged.
+                STATE_CACHE
+                    .lock()
+                    .expect("STATE_CACHE poisoned")
+                    .remove(&path);
                 return Err(StorageError::VersionConflict {
                     expected: expected_disk_version,
                     found: existing_state.version,
@@ -234,32 +376,125 @@ pub fn save_review_state(repo_path: &Path, state: &ReviewState) -> Result<(), St
         }
     }
 
-    let content = serde_json::to_string_pretty(state)?;
-    fs::write(&path, content)?;
+    // The new file is nearly always about the size of the one it replaces, so
+    // serialize into a buffer of that size instead of growing one from empty.
+    let mut content = Vec::with_capacity(existing_content.map_or(0, |c| c.len() + 256));
+    serde_json::to_writer_pretty(&mut content, state)?;
+    // The reviews directory nearly always exists already, so only create it
+    // when the write reports it missing rather than probing on every save.
+    let meta = match write_atomic(&path, &content) {
+        Err(e) if e.kind() == io::ErrorKind::NotFound => {
+            if let Some(storage_dir) = path.parent() {
+                fs::create_dir_all(storage_dir)?;
+            }
+            write_atomic(&path, &content)?
+        }
+        result => result?,
+    };
+
+    // What we just wrote is what the next load would parse. The stamp comes
+    // from the temp file, so a write that lands on the path right after our
+    // rename can't be cached as ours.
+    if let Some(stamp) = file_stamp(&meta) {
+        cache_state(&path, stamp, state);
+    }
 
     Ok(())
 }
 
+/// Read a file, treating a missing one as `None` — one `open` rather than an
+/// `exists` check followed by the read.
+fn read_if_exists(path: &Path) -> io::Result<Option<Vec<u8>>> {
+    match fs::read(path) {
+        Ok(content) => Ok(Some(content)),
+        Err(e) if e.kind() == io::ErrorKind::NotFound => Ok(None),
+        Err(e) => Err(e),
+    }
+}
+
+/// Write `content` to `path` atomically: write a sibling temp file, then
+/// rename it over the target. A crash, or a reader (the desktop app's file
+/// watcher, a concurrent CLI call) landing mid-save, sees either the old review
+/// or the new one — never a truncated file that would then fail to load.
+///
+/// Returns the temp file's metadata, taken before the rename (which keeps its
+/// mtime, length and inode).
+fn write_atomic(path: &Path, content: &[u8]) -> io::Result<fs::Metadata> {
+    static SEQ: AtomicU64 = AtomicU64::new(0);
+    // Unique per process and per call, so concurrent saves of the same review
+    // (the CLI and the app, or two app threads) never share a temp file. The
+    // `.tmp` extension keeps it out of `list_saved_reviews`.
+    let mut tmp_path = path.as_os_str().to_owned();
+    tmp_path.push(format!(
+        ".{}.{}.tmp",
+        std::process::id(),
+        SEQ.fetch_add(1, Ordering::Relaxed)
+    ));
+    let tmp_path = PathBuf::from(tmp_path);
+
+    fs::write(&tmp_path, content)?;
+    let renamed = fs::metadata(&tmp_path).and_then(|meta| {
+        fs::rename(&tmp_path, path)?;
+        Ok(meta)
+    });
+    renamed.inspect_err(|_| {
+        let _ = fs::remove_file(&tmp_path);
+    })
+}
+
+/// Summaries of review files, keyed by path and stamped like [`STATE_CACHE`].
+/// The sidebar lists every review in every repo and refreshes often; an
+/// unchanged file then costs the `stat` `read_dir` needs anyway, instead of a
+/// read and full parse just to count its hunks. Each listing prunes its
+/// directory's entries to the files it found, so deleted and renamed reviews
+/// don't linger in long-running processes.
+static SUMMARY_CACHE: LazyLock<Mutex<HashMap<PathBuf, (FileStamp, ReviewSummary)>>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
 /// List all saved reviews in the repository
 pub fn list_saved_reviews(repo_path: &Path) -> Result<Vec<ReviewSummary>, StorageError> {
     let storage_dir = get_storage_dir(repo_path)?;
 
-    if !storage_dir.exists() {
-        return Ok(Vec::new());
-    }
+    let mut seen = HashSet::new();
+    let entries = match fs::read_dir(&storage_dir) {
+        Ok(entries) => entries,
+        Err(e) if e.kind() == io::ErrorKind::NotFound => {
+            prune_summary_cache(&storage_dir, &seen);
+            return Ok(Vec::new());
+        }
+        Err(e) => return Err(e.into()),
+    };
 
     let mut summaries = Vec::new();
 
-    for entry in fs::read_dir(&storage_dir)? {
+    for entry in entries {
         let entry = entry?;
         let path = entry.path();
 
         // Only process .json files
         if path.extension().is_some_and(|ext| ext == "json") {
-            match fs::read_to_string(&path) {
+            seen.insert(path.clone());
+            let stamp = entry.metadata().ok().as_ref().and_then(file_stamp);
+            if let Some(stamp) = stamp {
+                let summary_cache = SUMMARY_CACHE.lock().expect("SUMMARY_CACHE poisoned");
+                if let Some((cached_stamp, summary)) = summary_cache.get(&path) {
+                    if *cached_stamp == stamp {
+                        summaries.push(summary.clone());
+                        continue;
+                    }
+                }
+            }
+            match fs::read(&path) {
                 Ok(content) => match deserialize_review(&content) {
                     Ok(state) => {
-                        summaries.push(state.to_summary());
+                        let summary = state.to_summary();
+                        if let Some(stamp) = stamp {
+                            SUMMARY_CACHE
+                                .lock()
+                                .expect("SUMMARY_CACHE poisoned")
+                                .insert(path, (stamp, summary.clone()));
+                        }
+                        summaries.push(summary);
                     }
                     Err(e) => {
                         // Old-schema (pre-ref `{base}..{head}`) and otherwise
@@ -282,12 +517,23 @@ pub fn list_saved_reviews(repo_path: &Path) -> Result<Vec<ReviewSummary>, Storag
         }
     }
 
+    prune_summary_cache(&storage_dir, &seen);
+
     // Sort by updated_at descending (most recent first)
     summaries.sort_by(|a, b| b.updated_at.cmp(&a.updated_at));
 
     Ok(summaries)
 }
 
+/// Drop cached summaries for files in `storage_dir` that a listing no longer
+/// found. Other repos' entries are left alone.
+fn prune_summary_cache(storage_dir: &Path, seen: &HashSet<PathBuf>) {
+    SUMMARY_CACHE
+        .lock()
+        .expect("SUMMARY_CACHE poisoned")
+        .retain(|path, _| path.parent() != Some(storage_dir) || seen.contains(path));
+}
+
 /// Create a review file on disk if it doesn't already exist.
 /// Used to make new reviews immediately visible in the sidebar.
 ///
@@ -305,9 +551,7 @@ pub fn ensure_review_exists(
 ) -> Result<(), StorageError> {
     central::register_repo(repo_path)?;
 
-    let storage_dir = get_storage_dir(repo_path)?;
-    let filename = review_filename(ref_name);
-    let path = storage_dir.join(&filename);
+    let path = review_path(repo_path, ref_name)?;
 
     if !path.exists() {
         let mut state = ReviewState::new(ref_name, base_override);
@@ -320,9 +564,7 @@ pub fn ensure_review_exists(
 
 /// Check whether a review file exists on disk for the given ref.
 pub fn review_exists(repo_path: &Path, ref_name: &str) -> Result<bool, StorageError> {
-    let storage_dir = get_storage_dir(repo_path)?;
-    let filename = review_filename(ref_name);
-    Ok(storage_dir.join(&filename).exists())
+    Ok(review_path(repo_path, ref_name)?.exists())
 }
 
 /// Set (or clear, with `None`) a review's base override. Identity is the ref, so
@@ -333,15 +575,11 @@ pub fn set_base_override(
     ref_name: &str,
     base_override: Option<String>,
 ) -> Result<(), StorageError> {
-    let storage_dir = get_storage_dir(repo_path)?;
-    let filename = review_filename(ref_name);
-    let path = storage_dir.join(&filename);
+    let path = review_path(repo_path, ref_name)?;
 
-    let mut state = if path.exists() {
-        let content = fs::read_to_string(&path)?;
-        deserialize_review(&content)?
-    } else {
-        ReviewState::new(ref_name, None)
+    let mut state = match read_if_exists(&path)? {
+        Some(content) => deserialize_review(&content)?,
+        None => ReviewState::new(ref_name, None),
     };
 
     state.base_override = base_override;
@@ -353,24 +591,24 @@ pub fn set_base_override(
 
 /// Delete a saved review
 pub fn delete_review(repo_path: &Path, ref_name: &str) -> Result<(), StorageError> {
-    let storage_dir = get_storage_dir(repo_path)?;
-    let filename = review_filename(ref_name);
-    let path = storage_dir.join(&filename);
+    let path = review_path(repo_path, ref_name)?;
+    SUMMARY_CACHE
+        .lock()
+        .expect("SUMMARY_CACHE poisoned")
+        .remove(&path);
 
-    if path.exists() {
-        fs::remove_file(&path)?;
+    match fs::remove_file(&path) {
+        Ok(()) => Ok(()),
+        Err(e) if e.kind() == io::ErrorKind::NotFound => Ok(()),
+        Err(e) => Err(e.into()),
     }
-
-    Ok(())
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
     use crate::review::central::tests::ENV_LOCK;
-    use crate::review::state::{
-        AnnotationSide, Attributed, HunkState, LineAnnotation, Source, REVIEW_SCHEMA_VERSION,
-    };
+    use crate::review::state::{AnnotationSide, Attributed, HunkState, LineAnnotation, Source};
     use tempfile::TempDir;
 
     /// The ref a test review is keyed by.
@@ -446,6 +684,110 @@ mod tests {
         assert_eq!(classification.reasoning, Some("Added import".to_string()));
     }
 
+    #[test]
+    fn test_save_leaves_no_temp_files_behind() {
+        let _lock = ENV_LOCK.lock().unwrap();
+        let (temp_dir, _review_home) = create_test_repo();
+        let repo_path = temp_dir.path().to_path_buf();
+
+        let mut state = ReviewState::new(TEST_REF, None);
+        save_review_state(&repo_path, &state).unwrap();
+        state.notes = "second save replaces the first".to_owned();
+        state.prepare_for_save();
+        save_review_state(&repo_path, &state).unwrap();
+
+        let names: Vec<String> = fs::read_dir(get_storage_dir(&repo_path).unwrap())
+            .unwrap()
+            .map(|entry| entry.unwrap().file_name().to_string_lossy().into_owned())
+            .collect();
+        assert_eq!(names, vec![review_filename(TEST_REF)]);
+        assert_eq!(
+            load_review_state(&repo_path, TEST_REF).unwrap().notes,
+            "second save replaces the first"
+        );
+    }
+
+    #[test]
+    fn test_load_sees_external_rewrites() {
+        let _lock = ENV_LOCK.lock().unwrap();
+        let (temp_dir, _review_home) = create_test_repo();
+        let repo_path = temp_dir.path().to_path_buf();
+
+        save_review_state(&repo_path, &ReviewState::new(TEST_REF, None)).unwrap();
+        assert!(load_review_state(&repo_path, TEST_REF)
+            .unwrap()
+            .notes
+            .is_empty());
+
+        // Another process rewrites the file behind the cache's back.
+        let mut state = ReviewState::new(TEST_REF, None);
+        state.notes = "written elsewhere".to_owned();
+        let path = get_storage_dir(&repo_path)
+            .unwrap()
+            .join(review_filename(TEST_REF));
+        fs::write(&path, serde_json::to_vec_pretty(&state).unwrap()).unwrap();
+
+        let loaded = load_review_state(&repo_path, TEST_REF).unwrap();
+        assert_eq!(loaded.notes, "written elsewhere");
+    }
+
+    #[test]
+    fn test_load_sees_same_length_rewrite_within_one_mtime() {
+        let _lock = ENV_LOCK.lock().unwrap();
+        let (temp_dir, _review_home) = create_test_repo();
+        let repo_path = temp_dir.path().to_path_buf();
+
+        let mut state = ReviewState::new(TEST_REF, None);
+        state.notes = "first".to_owned();
+        save_review_state(&repo_path, &state).unwrap();
+        assert_eq!(
+            load_review_state(&repo_path, TEST_REF).unwrap().notes,
+            "first"
+        );
+
+        // Another process replaces the file with one of the same length, and
+        // the filesystem's mtime granularity hides the change.
+        let path = get_storage_dir(&repo_path)
+            .unwrap()
+            .join(review_filename(TEST_REF));
+        let old_meta = fs::metadata(&path).unwrap();
+        state.notes = "other".to_owned();
+        let content = serde_json::to_vec_pretty(&state).unwrap();
+        assert_eq!(content.len() as u64, old_meta.len());
+        let tmp_path = path.with_extension("elsewhere");
+        fs::write(&tmp_path, content).unwrap();
+        fs::File::options()
+            .write(true)
+            .open(&tmp_path)
+            .unwrap()
+            .set_modified(old_meta.modified().unwrap())
+            .unwrap();
+        fs::rename(&tmp_path, &path).unwrap();
+
+        let loaded = load_review_state(&repo_path, TEST_REF).unwrap();
+        assert_eq!(loaded.notes, "other");
+    }
+
+    #[test]
+    fn test_state_cache_evicts_least_recently_used() {
+        let stamp: FileStamp = (SystemTime::UNIX_EPOCH, 0, 0);
+        let state = ReviewState::new(TEST_REF, None);
+        let path = |i: usize| PathBuf::from(format!("/reviews/{i}.json"));
+
+        let mut cache = StateCache::default();
+        for i in 0..STATE_CACHE_CAPACITY {
+            cache.insert(&path(i), stamp, &state);
+        }
+        // Touch the oldest entry so the second-oldest becomes the victim.
+        assert!(cache.get(&path(0), stamp).is_some());
+        cache.insert(&path(STATE_CACHE_CAPACITY), stamp, &state);
+
+        assert_eq!(cache.entries.len(), STATE_CACHE_CAPACITY);
+        assert!(cache.get(&path(0), stamp).is_some());
+        assert!(cache.get(&path(1), stamp).is_none());
+        assert!(cache.get(&path(STATE_CACHE_CAPACITY), stamp).is_some());
+    }
+
     #[test]
     fn test_annotation_fields_roundtrip() {
         let _lock = ENV_LOCK.lock().unwrap();
@@ -557,6 +899,37 @@ mod tests {
         assert_eq!(reviews.len(), 2);
     }
 
+    #[test]
+    fn test_list_saved_reviews_prunes_vanished_files() {
+        let _lock = ENV_LOCK.lock().unwrap();
+        let (temp_dir, _review_home) = create_test_repo();
+        let repo_path = temp_dir.path().to_path_buf();
+        let cached = |ref_name: &str| {
+            let path = review_path(&repo_path, ref_name).unwrap();
+            SUMMARY_CACHE
+                .lock()
+                .expect("SUMMARY_CACHE poisoned")
+                .contains_key(&path)
+        };
+
+        for ref_name in ["kept", "renamed", "deleted"] {
+            save_review_state(&repo_path, &ReviewState::new(ref_name, None)).unwrap();
+        }
+        assert_eq!(list_saved_reviews(&repo_path).unwrap().len(), 3);
+        assert!(cached("renamed") && cached("deleted"));
+
+        // One file moves aside outside the app; the other goes through
+        // `delete_review`.
+        let renamed = review_path(&repo_path, "renamed").unwrap();
+        fs::rename(&renamed, renamed.with_extension("bak")).unwrap();
+        delete_review(&repo_path, "deleted").unwrap();
+        assert!(!cached("deleted"));
+
+        assert_eq!(list_saved_reviews(&repo_path).unwrap().len(), 1);
+        assert!(cached("kept"));
+        assert!(!cached("renamed"));
+    }
+
     #[test]
     fn test_delete_review() {
         let _lock = ENV_LOCK.lock().unwrap();
@@ -657,6 +1030,30 @@ mod tests {
         assert!(matches!(err, StorageError::Migrate(_)));
     }
 
+    #[test]
+    fn test_load_rejects_obsolete_schema_that_fits_the_struct() {
+        let _lock = ENV_LOCK.lock().unwrap();
+        let (temp_dir, _review_home) = create_test_repo();
+        let repo_path = temp_dir.path().to_path_buf();
+
+        central::register_repo(&repo_path).unwrap();
+        let dir = get_storage_dir(&repo_path).unwrap();
+        fs::create_dir_all(&dir).unwrap();
+        // Deserializes cleanly into today's struct, but its schemaVersion says
+        // it predates refs — the typed fast path must not let it through.
+        fs::write(
+            dir.join(review_filename(TEST_REF)),
+            r#"{"schemaVersion":1,"ref":"feature","hunks":{},"trustList":[],"notes":"","createdAt":"x","updatedAt":"x","version":1}"#,
+        )
+        .unwrap();
+
+        let err = load_review_state(&repo_path, TEST_REF).unwrap_err();
+        assert!(matches!(
+            err,
+            StorageError::Migrate(migrate::MigrateError::Obsolete { found: 1 })
+        ));
+    }
+
     #[test]
     fn test_save_refuses_to_overwrite_unreadable_file() {
         let _lock = ENV_LOCK.lock().unwrap();
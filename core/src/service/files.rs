@@ -7,15 +7,16 @@
 use anyhow::{bail, Context};
 use log::{debug, info};
 use std::collections::HashSet;
+use std::io::Read;
 use std::path::Path;
 use std::time::Instant;
 
 use crate::diff::parser::{
-    compute_content_hash, create_binary_hunk, create_untracked_hunk, parse_diff,
-    parse_multi_file_diff, DiffHunk,
+    compute_content_hash, compute_reader_content_hash, create_binary_hunk, create_untracked_hunk,
+    parse_diff, parse_multi_file_diff, DiffHunk,
 };
 use crate::sources::local_git::{LocalGitSource, SearchMatch, VerifiedStatus};
-use crate::sources::traits::{Comparison, DiffSource, FileEntry, FileStatus};
+use crate::sources::traits::{Comparison, DiffSource, FileEntry};
 
 use super::util::{
     bytes_to_data_url, bytes_to_file_content, get_content_type, get_image_mime_type,
@@ -391,33 +392,19 @@ pub fn get_file_content(
 /// their diffs. Shared by the CLI, the HTTP server, and the desktop app so they
 /// all see the same hunk set — in particular to feed
 /// [`crate::review::state::ReviewState::reconcile`].
+///
+/// Asks git only for the changed paths: going through `list_files` would also
+/// run `ls-files` over the whole repo and stat every tracked file to build a
+/// tree that is immediately flattened back down to those same paths.
 pub fn comparison_hunks(
     repo_path: &Path,
     comparison: &Comparison,
 ) -> anyhow::Result<Vec<DiffHunk>> {
-    let files = list_files(repo_path, comparison)?;
-    let mut paths = Vec::new();
-    collect_changed_file_paths(&files, &mut paths);
-    get_all_hunks(repo_path, comparison, &paths)
-}
-
-/// Flatten a `FileEntry` tree into the paths the comparison actually touched.
-///
-/// `list_files` returns the whole working tree with the changed entries marked,
-/// so handing its full flattening to `get_all_hunks` makes every unchanged file
-/// in the repo a candidate it has to rule out.
-fn collect_changed_file_paths(entries: &[FileEntry], out: &mut Vec<String>) {
-    for entry in entries {
-        if entry.is_directory {
-            if let Some(children) = &entry.children {
-                collect_changed_file_paths(children, out);
-            }
-            continue;
-        }
-        if entry.status.as_ref().is_some_and(FileStatus::is_changed) {
-            out.push(entry.path.clone());
-        }
-    }
+    let source = LocalGitSource::new(repo_path.to_path_buf()).context("Failed to open repo")?;
+    let paths = source
+        .changed_file_paths(comparison)
+        .context("Failed to list changed files")?;
+    hunks_for_paths(&source, repo_path, comparison, &paths)
 }
 
 /// Batch-load all hunks for multiple files in a single call.
@@ -425,6 +412,19 @@ pub fn get_all_hunks(
     repo_path: &Path,
     comparison: &Comparison,
     file_paths: &[String],
+) -> anyhow::Result<Vec<DiffHunk>> {
+    let source = LocalGitSource::new(repo_path.to_path_buf()).context("Failed to open repo")?;
+    hunks_for_paths(&source, repo_path, comparison, file_paths)
+}
+
+/// [`get_all_hunks`] against an already-open source. Reusing the caller's
+/// source keeps its per-comparison lookups (the working-tree dir, which costs
+/// a `rev-parse` and a `worktree list`) from being redone.
+fn hunks_for_paths(
+    source: &LocalGitSource,
+    repo_path: &Path,
+    comparison: &Comparison,
+    file_paths: &[String],
 ) -> anyhow::Result<Vec<DiffHunk>> {
     let t0 = Instant::now();
     debug!(
@@ -437,8 +437,6 @@ pub fn get_all_hunks(
         .iter()
         .try_for_each(|fp| reject_path_traversal(fp))?;
 
-    let source = LocalGitSource::new(repo_path.to_path_buf()).context("Failed to open repo")?;
-
     // Untracked files live in the linked worktree when the head branch is checked out there.
     let content_root = source
         .working_tree_dir(comparison)
@@ -489,24 +487,8 @@ pub fn get_all_hunks(
         .peekable();
     if unhunked.peek().is_some() {
         let untracked = source.untracked_file_set(&content_root).unwrap_or_default();
-        for fp in unhunked {
-            if !untracked.contains(fp) {
-                continue;
-            }
-            let full_path = content_root.join(fp);
-            let (content_hash, text_content) = std::fs::read(&full_path)
-                .map(|bytes| {
-                    let hash = compute_content_hash(&bytes);
-                    let text = String::from_utf8(bytes).ok();
-                    (hash, text)
-                })
-                .unwrap_or_else(|_| ("00000000".to_owned(), None));
-            all_hunks.push(create_untracked_hunk(
-                fp,
-                &content_hash,
-                text_content.as_deref(),
-            ));
-        }
+        let new_files: Vec<&String> = unhunked.filter(|fp| untracked.contains(*fp)).collect();
+        all_hunks.extend(untracked_hunks(&content_root, &new_files));
     }
 
     // Filter to only include hunks for the requested files
@@ -522,6 +504,71 @@ pub fn get_all_hunks(
     Ok(all_hunks)
 }
 
+/// How much of an untracked file is checked before deciding whether it is text.
+const UNTRACKED_SNIFF_BYTES: u64 = 8 * 1024;
+
+/// Content hash of an untracked file, plus its text when it is UTF-8.
+///
+/// Text is always read whole — every line is shown for review, however large
+/// the file. A file whose first bytes aren't UTF-8 gets the placeholder hunk
+/// instead, and the rest of it is hashed as a stream so a large binary is
+/// never held in memory.
+fn read_untracked(path: &Path) -> std::io::Result<(String, Option<String>)> {
+    let mut file = std::fs::File::open(path)?;
+    let mut bytes = Vec::new();
+    (&mut file)
+        .take(UNTRACKED_SNIFF_BYTES)
+        .read_to_end(&mut bytes)?;
+    // `error_len() == None` is a character cut off by the sniff window.
+    if std::str::from_utf8(&bytes).is_err_and(|e| e.error_len().is_some()) {
+        let hash = compute_reader_content_hash(&mut bytes.as_slice().chain(file))?;
+        return Ok((hash, None));
+    }
+    file.read_to_end(&mut bytes)?;
+    let hash = compute_content_hash(&bytes);
+    Ok((hash, String::from_utf8(bytes).ok()))
+}
+
+/// Build the synthetic hunks for untracked files, reading them in parallel
+/// (one thread per chunk of files) since each is an independent read + hash.
+/// Hunks come back in `files` order.
+fn untracked_hunks(content_root: &Path, files: &[&String]) -> Vec<DiffHunk> {
+    let build = |chunk: &[&String]| -> Vec<DiffHunk> {
+        chunk
+            .iter()
+            .map(|fp| {
+                let (content_hash, text_content) = read_untracked(&content_root.join(fp))
+                    .unwrap_or_else(|_| ("00000000".to_owned(), None));
+                create_untracked_hunk(fp, &content_hash, text_content.as_deref())
+            })
+            .collect()
+    };
+    if files.len() <= 1 {
+        return build(files);
+    }
+    let threads = std::thread::available_parallelism()
+        .map(std::num::NonZeroUsize::get)
+        .unwrap_or(4)
+        .min(files.len());
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = files
+            .chunks(files.len().div_ceil(threads))
+            .map(|chunk| scope.spawn(|| build(chunk)))
+            .collect();
+        // A worker that panicked must not shrink the hunk set: callers
+        // reconcile saved decisions against it and would drop the missing
+        // files' ones. Re-raise the panic as if the work had run inline.
+        handles
+            .into_iter()
+            .flat_map(|handle| {
+                handle
+                    .join()
+                    .unwrap_or_else(|panic| std::panic::resume_unwind(panic))
+            })
+            .collect()
+    })
+}
+
 /// Get file content for working tree diff (staged or unstaged).
 pub fn get_working_tree_file_content(
     repo_path: &Path,
@@ -973,4 +1020,24 @@ mod tests {
             "old content should come from the merge-base, not the default branch tip"
         );
     }
+
+    #[test]
+    fn read_untracked_keeps_large_text_and_streams_binary() {
+        let dir = tempfile::tempdir().unwrap();
+
+        let text = "let x = 1; // é\n".repeat(200_000);
+        let text_path = dir.path().join("big.rs");
+        std::fs::write(&text_path, &text).unwrap();
+        let (hash, content) = read_untracked(&text_path).unwrap();
+        assert_eq!(hash, compute_content_hash(text.as_bytes()));
+        assert_eq!(content.as_deref(), Some(text.as_str()));
+
+        let mut binary = vec![0xff, 0xfe, 0x00];
+        binary.extend(vec![0xab; 100_000]);
+        let binary_path = dir.path().join("blob.bin");
+        std::fs::write(&binary_path, &binary).unwrap();
+        let (hash, content) = read_untracked(&binary_path).unwrap();
+        assert_eq!(hash, compute_content_hash(&binary));
+        assert!(content.is_none());
+    }
 }
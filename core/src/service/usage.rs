@@ -355,8 +355,13 @@ fn recent_session_files(sessions_dir: &Path, limit: usize) -> Vec<(PathBuf, Opti
         })
         .collect();
 
+    // Only the newest `limit` are wanted: partition those to the front and
+    // sort just them, rather than sorting every session ever recorded.
+    if files.len() > limit {
+        files.select_nth_unstable_by(limit, |a, b| b.1.cmp(&a.1));
+        files.truncate(limit);
+    }
     files.sort_by(|a, b| b.1.cmp(&a.1));
-    files.truncate(limit);
     files
         .into_iter()
         .map(|(path, modified)| (path, to_unix(modified)))
@@ -603,4 +608,27 @@ mod tests {
         assert_eq!(codex_window_label(Some(45)), "45m");
         assert_eq!(codex_window_label(None), "Limit");
     }
+
+    #[test]
+    fn recent_session_files_keeps_the_newest_in_order() {
+        let dir = tempfile::tempdir().unwrap();
+        let day = dir.path().join("2025/01/02");
+        std::fs::create_dir_all(&day).unwrap();
+        for (name, secs) in [("a", 300), ("b", 100), ("c", 500), ("d", 200), ("e", 400)] {
+            let path = day.join(format!("{name}.jsonl"));
+            let file = std::fs::File::create(&path).unwrap();
+            file.set_modified(UNIX_EPOCH + Duration::from_secs(secs))
+                .unwrap();
+        }
+        std::fs::write(dir.path().join("notes.txt"), "").unwrap();
+
+        let recent = recent_session_files(dir.path(), 3);
+        let names: Vec<_> = recent
+            .iter()
+            .map(|(p, _)| p.file_stem().unwrap().to_str().unwrap())
+            .collect();
+        assert_eq!(names, ["c", "e", "a"]);
+        assert_eq!(recent[0].1, Some(500));
+        assert_eq!(recent_session_files(dir.path(), 10).len(), 5);
+    }
 }
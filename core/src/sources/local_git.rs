@@ -6,6 +6,7 @@ use crate::diff::parser::{parse_diff, LineType};
 use crate::review::central;
 use log::info;
 use serde::Serialize;
+use std::collections::hash_map::Entry;
 use std::collections::{HashMap, HashSet};
 use std::io::Write;
 use std::path::PathBuf;
@@ -127,6 +128,15 @@ pub struct WorktreeInfo {
     pub is_review_managed: bool,
 }
 
+/// What a comparison changed. See [`LocalGitSource::changed_file_status`].
+struct ChangedFiles {
+    file_status: HashMap<String, FileStatus>,
+    rename_map: HashMap<String, String>,
+    /// The directory the statuses were taken from — a linked worktree when the
+    /// comparison reviews one, otherwise the main repo.
+    root: PathBuf,
+}
+
 /// Tracked + untracked files and change statuses for a comparison, gathered
 /// from the directory its head branch is checked out in. Shared by
 /// `list_files` and `list_all_files`.
@@ -819,10 +829,12 @@ impl LocalGitSource {
         if let Ok(reviews) = crate::review::storage::list_saved_reviews(&self.repo_path) {
             for r in reviews {
                 if let Some(wt_path) = r.worktree_path {
-                    if !worktree_map.contains_key(&r.ref_name)
-                        && std::path::Path::new(&wt_path).exists()
-                    {
-                        worktree_map.insert(r.ref_name, wt_path);
+                    // One hash lookup for both the "git already knows this
+                    // branch" check and the insert.
+                    if let Entry::Vacant(slot) = worktree_map.entry(r.ref_name) {
+                        if std::path::Path::new(&wt_path).exists() {
+                            slot.insert(wt_path);
+                        }
                     }
                 }
             }
@@ -2020,12 +2032,9 @@ impl LocalGitSource {
         Ok(!output.trim().is_empty())
     }
 
-    /// Gather change statuses plus the tracked and untracked files of the
-    /// directory the comparison's head branch is checked out in.
-    fn working_tree_files(
-        &self,
-        comparison: &Comparison,
-    ) -> Result<WorkingTreeFiles, LocalGitError> {
+    /// Change statuses (including untracked files when the comparison reviews a
+    /// working tree) and renames, plus the directory they were taken from.
+    fn changed_file_status(&self, comparison: &Comparison) -> Result<ChangedFiles, LocalGitError> {
         let (mut file_status, rename_map) = self.get_changed_files(comparison)?;
 
         let wt_dir = self.working_tree_dir(comparison);
@@ -2039,6 +2048,43 @@ impl LocalGitSource {
             }
         }
 
+        Ok(ChangedFiles {
+            file_status,
+            rename_map,
+            root,
+        })
+    }
+
+    /// The paths a comparison changes, sorted. The same set `list_files` marks
+    /// as changed, without listing every tracked file or building the tree —
+    /// for callers that only want the changed paths.
+    pub fn changed_file_paths(
+        &self,
+        comparison: &Comparison,
+    ) -> Result<Vec<String>, LocalGitError> {
+        let mut paths: Vec<String> = self
+            .changed_file_status(comparison)?
+            .file_status
+            .into_iter()
+            .filter(|(_, status)| status.is_changed())
+            .map(|(path, _)| path)
+            .collect();
+        paths.sort_unstable();
+        Ok(paths)
+    }
+
+    /// Gather change statuses plus the tracked and untracked files of the
+    /// directory the comparison's head branch is checked out in.
+    fn working_tree_files(
+        &self,
+        comparison: &Comparison,
+    ) -> Result<WorkingTreeFiles, LocalGitError> {
+        let ChangedFiles {
+            file_status,
+            rename_map,
+            root,
+        } = self.changed_file_status(comparison)?;
+
         let mut all_files: HashSet<String> = self
             .run_git_in(&root, &["ls-files"])?
             .lines()
@@ -2354,6 +2400,10 @@ impl LocalGitSource {
         file_path: &str,
         content_hashes: &[String],
     ) -> Result<(), LocalGitError> {
+        // An empty selection can't build a patch; fail before running `git diff`.
+        if content_hashes.is_empty() {
+            return Err(no_hunks_matched());
+        }
         let raw_diff = self.get_raw_file_diff(file_path, false)?;
         self.stage_hunks_with_diff(file_path, &raw_diff, content_hashes)
     }
@@ -2385,6 +2435,10 @@ impl LocalGitSource {
         file_path: &str,
         content_hashes: &[String],
     ) -> Result<(), LocalGitError> {
+        // An empty selection can't build a patch; fail before running `git diff`.
+        if content_hashes.is_empty() {
+            return Err(no_hunks_matched());
+        }
         let raw_diff = self.get_raw_file_diff(file_path, true)?;
         self.unstage_hunks_with_diff(file_path, &raw_diff, content_hashes)
     }
@@ -3048,6 +3102,9 @@ fn build_selective_patch(
     file_path: &str,
     content_hashes: &[String],
 ) -> Result<String, LocalGitError> {
+    if content_hashes.is_empty() {
+        return Err(no_hunks_matched());
+    }
     let hash_set: HashSet<&str> = content_hashes.iter().map(|s| s.as_str()).collect();
 
     // Parse the diff to get content hashes per hunk
@@ -3075,14 +3132,16 @@ fn build_selective_patch(
     }
 
     if patch.len() == initial_len {
-        return Err(LocalGitError::Git(
-            "No hunks matched the provided content hashes".to_owned(),
-        ));
+        return Err(no_hunks_matched());
     }
 
     Ok(patch)
 }
 
+fn no_hunks_matched() -> LocalGitError {
+    LocalGitError::Git("No hunks matched the provided content hashes".to_owned())
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -3383,6 +3442,68 @@ mod tests {
         );
     }
 
+    /// `changed_file_paths` is the changed subset of `list_files`: committed
+    /// changes, deletions, and a linked worktree's uncommitted and untracked
+    /// files, without the unchanged tracked ones.
+    #[test]
+    fn test_changed_file_paths_matches_list_files() {
+        use crate::review::central::tests::ENV_LOCK;
+        use crate::sources::traits::Comparison;
+
+        let _lock = ENV_LOCK.lock().unwrap();
+        let (_env, _review_home, repo_dir, _source, _head_sha) = setup_worktree_test();
+        let repo_path = repo_dir.path();
+
+        for name in ["tracked.txt", "gone.txt", "unchanged.txt"] {
+            std::fs::write(repo_path.join(name), format!("{name}\n")).unwrap();
+        }
+        run_git_cmd(repo_path, &["add", "."]).unwrap();
+        run_git_cmd(repo_path, &["commit", "-m", "base files"]).unwrap();
+        let base_sha = run_git_cmd(repo_path, &["rev-parse", "HEAD"])
+            .unwrap()
+            .trim()
+            .to_owned();
+
+        let wt_path = repo_dir.path().join("wt");
+        let wt_path_str = wt_path.to_string_lossy().to_string();
+        run_git_cmd(
+            repo_path,
+            &["worktree", "add", &wt_path_str, "-b", "wt-branch"],
+        )
+        .unwrap();
+
+        // One committed change on the branch, then uncommitted ones on top.
+        std::fs::write(wt_path.join("committed.txt"), "committed\n").unwrap();
+        run_git_cmd(&wt_path, &["add", "committed.txt"]).unwrap();
+        run_git_cmd(&wt_path, &["commit", "-m", "add committed"]).unwrap();
+        std::fs::write(wt_path.join("tracked.txt"), "modified in worktree\n").unwrap();
+        std::fs::remove_file(wt_path.join("gone.txt")).unwrap();
+        std::fs::write(wt_path.join("untracked.txt"), "from worktree\n").unwrap();
+
+        let source = LocalGitSource::new(repo_path.to_path_buf()).unwrap();
+        let comparison = Comparison::new(&base_sha, "wt-branch");
+
+        fn changed_leaves(entries: &[FileEntry], out: &mut Vec<String>) {
+            for e in entries {
+                if let Some(children) = &e.children {
+                    changed_leaves(children, out);
+                } else if e.status.as_ref().is_some_and(FileStatus::is_changed) {
+                    out.push(e.path.clone());
+                }
+            }
+        }
+        let mut listed = Vec::new();
+        changed_leaves(&source.list_files(&comparison).unwrap(), &mut listed);
+        listed.sort_unstable();
+
+        let changed = source.changed_file_paths(&comparison).unwrap();
+        assert_eq!(
+            changed,
+            ["committed.txt", "gone.txt", "tracked.txt", "untracked.txt"]
+        );
+        assert_eq!(changed, listed);
+    }
+
     /// The old side of a diff must be the merge-base, not the base branch's
     /// tip: a head that is behind `base` should not show `base`'s newer commits
     /// as diff noise.
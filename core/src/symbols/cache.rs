@@ -36,7 +36,7 @@ pub fn compute_hash(input: &str) -> String {
 /// Return the cache file path for a given repo + comparison.
 fn cache_path(repo_path: &Path, comparison: &Comparison) -> Result<PathBuf> {
     let cache_dir = central::get_repo_cache_dir(repo_path)?;
-    let filename = format!("{}.json", central::sanitize_path_component(&comparison.key));
+    let filename = central::json_file_name(&comparison.key);
     Ok(cache_dir.join("symbol-cache").join(filename))
 }
 
@@ -49,10 +49,11 @@ pub fn load(
     current_diff_hash: &str,
 ) -> Result<Option<Vec<FileSymbolDiff>>> {
     let path = cache_path(repo_path, comparison)?;
-    if !path.exists() {
-        return Ok(None);
-    }
-    let content = fs::read_to_string(&path)?;
+    let content = match fs::read_to_string(&path) {
+        Ok(content) => content,
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(None),
+        Err(e) => return Err(e.into()),
+    };
     let cached: SymbolDiffCache = serde_json::from_str(&content)?;
     if cached.version == CACHE_VERSION && cached.diff_hash == current_diff_hash {
         Ok(Some(cached.symbol_diffs))
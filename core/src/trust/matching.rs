@@ -21,6 +21,46 @@ pub fn matches_pattern(label: &str, pattern: &str) -> bool {
     simple_glob_match(label, pattern)
 }
 
+/// A trust list prepared for repeated matching.
+///
+/// Exact patterns (the common case — the default trust list is every taxonomy
+/// ID) go into a hash set for O(1) lookup; only wildcard patterns are tried one
+/// by one. Build it once per pass over a review's hunks rather than scanning
+/// the whole list for every label.
+#[derive(Debug, Default)]
+pub struct TrustSet<'a> {
+    exact: std::collections::HashSet<&'a str>,
+    wildcards: Vec<&'a str>,
+}
+
+impl<'a> TrustSet<'a> {
+    pub fn new(patterns: &'a [String]) -> Self {
+        let mut set = Self::default();
+        for pattern in patterns {
+            if pattern.contains('*') {
+                set.wildcards.push(pattern);
+            } else {
+                set.exact.insert(pattern);
+            }
+        }
+        set
+    }
+
+    /// Whether `label` matches any pattern in the set.
+    pub fn matches(&self, label: &str) -> bool {
+        self.exact.contains(label)
+            || self
+                .wildcards
+                .iter()
+                .any(|pattern| simple_glob_match(label, pattern))
+    }
+
+    /// Whether any of `labels` matches a pattern in the set.
+    pub fn matches_any(&self, labels: &[String]) -> bool {
+        labels.iter().any(|label| self.matches(label))
+    }
+}
+
 /// Simple glob matching without regex crate.
 /// Supports `*` as a wildcard that matches any sequence of characters.
 fn simple_glob_match(label: &str, pattern: &str) -> bool {
@@ -162,4 +202,28 @@ mod tests {
     fn test_empty_pattern_list() {
         assert!(!matches_any_pattern("imports:added", &[]));
     }
+
+    #[test]
+    fn test_trust_set_agrees_with_matches_pattern() {
+        let patterns = vec![
+            "imports:added".to_string(),
+            "formatting:*".to_string(),
+            "*:removed".to_string(),
+        ];
+        let set = TrustSet::new(&patterns);
+        for label in [
+            "imports:added",
+            "imports:removed",
+            "imports:modified",
+            "formatting:whitespace",
+            "code:logic",
+        ] {
+            assert_eq!(
+                set.matches(label),
+                matches_any_pattern(label, &patterns),
+                "{label}"
+            );
+        }
+        assert!(!TrustSet::new(&[]).matches("imports:added"));
+    }
 }
@@ -2,4 +2,4 @@ pub mod matching;
 pub mod patterns;
 
 // Export pattern matching functions for use across the codebase
-pub use matching::matches_pattern;
+pub use matching::{matches_pattern, TrustSet};
@@ -1,4 +1,5 @@
 use serde::{Deserialize, Serialize};
+use std::sync::LazyLock;
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct TrustPattern {
@@ -50,17 +51,28 @@ fn load_taxonomy_from_json() -> Vec<TrustCategory> {
     }
 }
 
+/// The bundled taxonomy, parsed once per process. It is compiled into the
+/// binary, so it can't change underneath us — and every new review state
+/// (including the empty state returned for a review not yet saved) seeds its
+/// trust list from it.
+static TAXONOMY: LazyLock<Vec<TrustCategory>> = LazyLock::new(load_taxonomy_from_json);
+
+/// All pattern IDs in [`TAXONOMY`], in taxonomy order.
+static PATTERN_IDS: LazyLock<Vec<String>> = LazyLock::new(|| {
+    TAXONOMY
+        .iter()
+        .flat_map(|cat| cat.patterns.iter().map(|p| p.id.clone()))
+        .collect()
+});
+
 /// The full taxonomy of trust patterns (bundled)
 pub fn get_trust_taxonomy() -> Vec<TrustCategory> {
-    load_taxonomy_from_json()
+    TAXONOMY.clone()
 }
 
 /// Return all pattern IDs from the taxonomy (e.g. "imports:added", "formatting:whitespace", etc.)
 pub fn get_all_pattern_ids() -> Vec<String> {
-    get_trust_taxonomy()
-        .into_iter()
-        .flat_map(|cat| cat.patterns.into_iter().map(|p| p.id))
-        .collect()
+    PATTERN_IDS.clone()
 }
 
 /// Fallback hardcoded taxonomy in case JSON loading fails
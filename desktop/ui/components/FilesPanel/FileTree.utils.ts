@@ -1,5 +1,5 @@
 import type { FileEntry, ReviewState, StatusEntry } from "../../types";
-import { isHunkTrusted } from "../../types";
+import { hunkTrustChecker } from "../../types";
 import type { FileSortOrder } from "../../stores/slices/preferencesSlice";
 import type {
   FileHunkStatus,
@@ -37,12 +37,12 @@ export function calculateFileHunkStatus(
   },
 ): Map<string, FileHunkStatus> {
   const statusMap = new Map<string, FileHunkStatus>();
+  const isTrusted = hunkTrustChecker(reviewState?.trustList ?? []);
 
   for (const hunk of hunks) {
     const current = statusMap.get(hunk.filePath) ?? { ...EMPTY_HUNK_STATUS };
 
     const hunkState = reviewState?.hunks[hunk.id];
-    const trustList = reviewState?.trustList ?? [];
 
     if (hunkState?.status?.value === "rejected") {
       current.rejected++;
@@ -50,7 +50,7 @@ export function calculateFileHunkStatus(
       current.approved++;
     } else if (hunkState?.status?.value === "saved_for_later") {
       current.savedForLater++;
-    } else if (isHunkTrusted(hunkState, trustList)) {
+    } else if (isTrusted(hunkState)) {
       current.trusted++;
     } else if (
       options?.autoApproveStaged &&
@@ -2,12 +2,7 @@ import { type ReactNode, useState, useMemo, useEffect, useRef } from "react";
 import { useReviewStore } from "../../stores";
 import { useAllHunks } from "../../stores/selectors/hunks";
 import { useTrustCounts, useKnownPatternIds } from "../../hooks/useTrustCounts";
-import {
-  anyLabelMatchesPattern,
-  hunkLabels,
-  type HunkState,
-  type TrustCategory,
-} from "../../types";
+import { hunkLabels, type HunkState, type TrustCategory } from "../../types";
 import { getApiClient } from "../../api";
 import { Checkbox } from "../ui/checkbox";
 import { playApproveSound, playBulkSound } from "../../utils/sounds";
@@ -19,6 +14,8 @@ interface PatternInfo {
   categoryId: string;
   categoryName: string;
   count: number;
+  /** Hunks carrying this pattern's label, so a preview needs no rescan. */
+  hunkIds: string[];
   trusted: boolean;
 }
 
@@ -35,12 +32,19 @@ function buildPatternList(
     }
   }
 
-  const counts = new Map<string, number>();
+  // Inverted index, label -> hunk IDs, built in the same single pass that
+  // used to only count: the row counts and the preview both read from it.
+  const hunkIdsByLabel = new Map<string, string[]>();
   for (const hunk of hunks) {
     const labels = hunkStates ? hunkLabels(hunkStates[hunk.id]) : [];
     for (const label of labels) {
       if (knownPatternIds.has(label)) {
-        counts.set(label, (counts.get(label) ?? 0) + 1);
+        const ids = hunkIdsByLabel.get(label);
+        if (!ids) {
+          hunkIdsByLabel.set(label, [hunk.id]);
+        } else if (ids[ids.length - 1] !== hunk.id) {
+          ids.push(hunk.id);
+        }
       }
     }
   }
@@ -50,13 +54,15 @@ function buildPatternList(
   const result: PatternInfo[] = [];
   for (const category of categories) {
     for (const pattern of category.patterns) {
+      const hunkIds = hunkIdsByLabel.get(pattern.id) ?? [];
       result.push({
         id: pattern.id,
         name: pattern.name,
         description: pattern.description,
         categoryId: category.id,
         categoryName: category.name,
-        count: counts.get(pattern.id) ?? 0,
+        count: hunkIds.length,
+        hunkIds,
         trusted: trustSet.has(pattern.id),
       });
     }
@@ -178,20 +184,12 @@ export function TrustSection(): ReactNode {
   };
 
   const handlePreview = (patternId: string) => {
-    const patternName =
-      patterns.find((p) => p.id === patternId)?.name ?? patternId;
-    const hunkIds = hunks
-      .filter((hunk) => {
-        const labels = hunkLabels(reviewState?.hunks[hunk.id]);
-        return anyLabelMatchesPattern(labels, patternId);
-      })
-      .map((hunk) => hunk.id);
-
-    if (hunkIds.length === 0) return;
+    const pattern = patterns.find((p) => p.id === patternId);
+    if (!pattern || pattern.hunkIds.length === 0) return;
 
     useReviewStore.getState().openAdhocGroup({
-      title: patternName,
-      hunkIds,
+      title: pattern.name,
+      hunkIds: pattern.hunkIds,
       badgeLabel: "Trust pattern",
     });
   };
@@ -18,11 +18,28 @@ export interface ReviewProgress {
   state: ReviewStateValue;
 }
 
+// Cached on input identity. The status bar, overview, tab rail, feedback panel
+// and the slice's global-review patch all tally the same hunks + review state,
+// so the O(n) pass runs once per actual change rather than once per caller.
+let progressCache: {
+  hunks: DiffHunk[];
+  reviewState: ReviewState | null;
+  output: ReviewProgress;
+} | null = null;
+
 /** Pure computation of review progress from hunks + review state. */
 export function computeReviewProgress(
   hunks: DiffHunk[],
   reviewState: ReviewState | null,
 ): ReviewProgress {
+  if (
+    progressCache &&
+    progressCache.hunks === hunks &&
+    progressCache.reviewState === reviewState
+  ) {
+    return progressCache.output;
+  }
+
   const totalHunks = hunks.length;
 
   // Single pass over hunks to count all status categories
@@ -63,7 +80,7 @@ export function computeReviewProgress(
     state = "approved";
   }
 
-  return {
+  const output: ReviewProgress = {
     totalHunks,
     trustedHunks,
     approvedHunks,
@@ -74,6 +91,8 @@ export function computeReviewProgress(
     reviewedPercent,
     state,
   };
+  progressCache = { hunks, reviewState, output };
+  return output;
 }
 
 export function useReviewProgress(): ReviewProgress {
@@ -1,7 +1,7 @@
 import { useMemo, useState, useEffect } from "react";
 import { useReviewStore } from "../stores";
 import { useAllHunks } from "../stores/selectors/hunks";
-import { anyLabelMatchesPattern, hunkLabels } from "../types";
+import { hunkLabels, hunkTrustChecker } from "../types";
 import { getApiClient } from "../api";
 
 // `getTrustTaxonomy` is in the client's coalesced-reads set, so overlapping
@@ -53,12 +53,10 @@ export function useTrustCounts(knownPatternIds?: Set<string>): TrustCounts {
 
   const trustedHunkCount = useMemo(() => {
     if (trustList.length === 0) return 0;
-    return hunks.filter((hunk) => {
-      const labels = hunkLabels(reviewState?.hunks[hunk.id]);
-      return trustList.some((pattern) =>
-        anyLabelMatchesPattern(labels, pattern),
-      );
-    }).length;
+    const isTrusted = hunkTrustChecker(trustList);
+    return hunks.filter((hunk) =>
+      isTrusted(reviewState?.hunks[hunk.id]),
+    ).length;
   }, [hunks, reviewState?.hunks, trustList]);
 
   const trustableHunkCount = useMemo(() => {
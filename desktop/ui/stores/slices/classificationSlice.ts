@@ -8,7 +8,8 @@ export interface ClassificationSlice {
   classifiedHunkIds: string[] | null;
 
   // Actions
-  classifyStaticHunks: (hunkIds?: string[]) => Promise<void>;
+  /** Resolves to whether it saved the review state. */
+  classifyStaticHunks: (hunkIds?: string[]) => Promise<boolean>;
   reclassifyHunks: (hunkIds?: string[]) => Promise<void>;
   isClassificationStale: () => boolean;
 }
@@ -35,14 +36,14 @@ export const createClassificationSlice: SliceCreatorWithClient<
 
   classifyStaticHunks: async (hunkIds) => {
     const { reviewState, saveReviewState, startActivity, endActivity } = get();
-    if (!reviewState) return;
+    if (!reviewState) return false;
     const hunks = getAllHunksFromState(get());
 
     const hunksToClassify = filterHunks(hunks, hunkIds).filter((hunk) =>
       isHunkUnclassified(reviewState.hunks[hunk.id]),
     );
 
-    if (hunksToClassify.length === 0) return;
+    if (hunksToClassify.length === 0) return false;
 
     const { repoPath } = get();
     const comparisonKey = get().comparison?.key;
@@ -52,10 +53,11 @@ export const createClassificationSlice: SliceCreatorWithClient<
     // loadGitStatus/loadAttribution/etc).
     const isStale = () =>
       get().repoPath !== repoPath || get().comparison?.key !== comparisonKey;
+    let saved = false;
     startActivity("classify-static", "Classifying hunks", 50);
     try {
       const staticResponse = await client.classifyHunksStatic(hunksToClassify);
-      if (isStale()) return;
+      if (isStale()) return saved;
       const staticCount = Object.keys(staticResponse.classifications).length;
 
       if (staticCount > 0) {
@@ -87,7 +89,8 @@ export const createClassificationSlice: SliceCreatorWithClient<
 
           set({ reviewState: updatedState });
           await saveReviewState();
-          if (isStale()) return;
+          saved = true;
+          if (isStale()) return saved;
         }
       }
 
@@ -101,6 +104,7 @@ export const createClassificationSlice: SliceCreatorWithClient<
     } finally {
       endActivity("classify-static");
     }
+    return saved;
   },
 
   reclassifyHunks: async (hunkIds) => {
@@ -134,11 +138,15 @@ export const createClassificationSlice: SliceCreatorWithClient<
     };
 
     set({ reviewState: newState });
-    await saveReviewState();
 
-    // Now classify them (they're now "unlabeled")
+    // Now classify them (they're now "unlabeled"). One write covers both
+    // steps when classifyStaticHunks relabels anything; whenever it didn't
+    // save — nothing matched, it went stale, or it failed — save here.
     const { classifyStaticHunks } = get();
-    await classifyStaticHunks(targetHunks.map((h) => h.id));
+    const saved = await classifyStaticHunks(targetHunks.map((h) => h.id));
+    if (!saved) {
+      await saveReviewState();
+    }
   },
 
   isClassificationStale: () => {
@@ -92,8 +92,9 @@ export const createHistorySlice: SliceCreatorWithClient<HistorySlice> =
       }
       // Scoped to the repo whose diff moved — a working-tree edit in one repo
       // says nothing about the reviews open against another.
+      const prefix = `${repoPath} `;
       for (const key of attributionCache.keys()) {
-        if (key.startsWith(`${repoPath} `)) attributionCache.delete(key);
+        if (key.startsWith(prefix)) attributionCache.delete(key);
       }
     },
   });
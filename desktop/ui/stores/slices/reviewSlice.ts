@@ -227,30 +227,46 @@ function updateHunkStatuses(
   if (!reviewState || hunkIds.length === 0) return;
 
   const newHunks = { ...reviewState.hunks };
+  let changed = false;
 
   for (const id of hunkIds) {
     if (options?.skipMissing && !newHunks[id]) continue;
+    const current = newHunks[id]?.status;
     if (status) {
+      // Already set to exactly this by the UI — nothing to write.
+      if (
+        current?.value === status &&
+        current.source === "ui" &&
+        current.reasoning == null
+      ) {
+        continue;
+      }
       newHunks[id] = {
         ...newHunks[id],
         status: attributed(status, "ui"),
       };
-    } else if (newHunks[id]) {
+      changed = true;
+    } else if (current) {
       newHunks[id] = {
         ...newHunks[id],
         status: undefined,
       };
+      changed = true;
     }
   }
 
-  const newState = {
-    ...reviewState,
-    hunks: newHunks,
-    updatedAt: new Date().toISOString(),
-  };
-  set({ reviewState: newState });
-
-  debouncedSave(saveReviewState);
+  // Re-approving approved hunks (or clearing already-clear ones) leaves the
+  // state as it was: skip the new state object, updatedAt bump, and save.
+  if (changed) {
+    set({
+      reviewState: {
+        ...reviewState,
+        hunks: newHunks,
+        updatedAt: new Date().toISOString(),
+      },
+    });
+    debouncedSave(saveReviewState);
+  }
 
   // Sound feedback
   if (status === "approved" && hunkIds.length > 1) {
@@ -311,6 +327,7 @@ function getDirHunkIds(
 
 /**
  * Merge partial fields into the current reviewState, set updatedAt, and trigger a debounced save.
+ * A patch whose fields all already hold those values is a no-op (no updatedAt bump, no save).
  * Returns false if reviewState is null (no update performed).
  */
 function patchReviewState(
@@ -324,6 +341,11 @@ function patchReviewState(
   const { reviewState, saveReviewState } = get();
   if (!reviewState) return false;
 
+  const keys = Object.keys(patch) as (keyof ReviewState)[];
+  if (keys.every((key) => Object.is(reviewState[key], patch[key]))) {
+    return true;
+  }
+
   set({
     reviewState: {
       ...reviewState,
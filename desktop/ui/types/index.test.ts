@@ -3,6 +3,7 @@ import {
   makeComparison,
   isHunkTrusted,
   isHunkReviewed,
+  hunkTrustChecker,
   attributed,
   type HunkState,
 } from "./index";
@@ -76,6 +77,26 @@ describe("isHunkTrusted", () => {
   });
 });
 
+describe("hunkTrustChecker", () => {
+  const trustList = ["imports:*", "formatting:whitespace"];
+
+  it("agrees with isHunkTrusted across hunks sharing labels", () => {
+    const isTrusted = hunkTrustChecker(trustList);
+    const states: (HunkState | undefined)[] = [
+      undefined,
+      { classification: attributed([], "static") },
+      { classification: attributed(["imports:added"], "static") },
+      { classification: attributed(["code:logic"], "static") },
+      { classification: attributed(["code:logic", "imports:added"], "static") },
+      { classification: attributed(["formatting:whitespace"], "static") },
+      { classification: attributed(["imports:added"], "static") },
+    ];
+    for (const hs of states) {
+      expect(isTrusted(hs)).toBe(isHunkTrusted(hs, trustList));
+    }
+  });
+});
+
 describe("isHunkReviewed", () => {
   const trustList = ["imports:*"];
 
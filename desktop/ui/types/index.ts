@@ -16,6 +16,24 @@
 //
 // ========================================================================
 
+// Compiled wildcard patterns, keyed by pattern. Trust lists hold a few dozen
+// distinct patterns, so this stays small while sparing every trust check the
+// escape + `new RegExp`.
+const wildcardRegexes = new Map<string, RegExp>();
+
+function wildcardRegex(pattern: string): RegExp {
+  let regex = wildcardRegexes.get(pattern);
+  if (!regex) {
+    // Escape special regex characters except *
+    const escaped = pattern.replace(/[.+?^${}()|[\]\\]/g, "\\$&");
+    // Convert * to regex .*
+    const regexPattern = escaped.replace(/\*/g, ".*");
+    regex = new RegExp(`^${regexPattern}$`);
+    wildcardRegexes.set(pattern, regex);
+  }
+  return regex;
+}
+
 /**
  * Check if a label matches a pattern.
  * Supports wildcards (`*`) that match any sequence of characters.
@@ -26,14 +44,7 @@ export function matchesPattern(label: string, pattern: string): boolean {
     return label === pattern;
   }
 
-  // Convert glob pattern to regex
-  // Escape special regex characters except *
-  const escaped = pattern.replace(/[.+?^${}()|[\]\\]/g, "\\$&");
-  // Convert * to regex .*
-  const regexPattern = escaped.replace(/\*/g, ".*");
-  const regex = new RegExp(`^${regexPattern}$`);
-
-  return regex.test(label);
+  return wildcardRegex(pattern).test(label);
 }
 
 /**
@@ -410,8 +421,9 @@ export function isHunkUnclassified(hunkState: HunkState | undefined): boolean {
 
 // Whether a hunk is auto-approved by the trust list — i.e. its label is
 // trust-listed. (An explicit approve/reject still wins — callers check
-// `status` before this.) This is the single chokepoint every "is it
-// effectively reviewed/trusted" consumer routes through.
+// `status` before this.) Every "is it effectively reviewed/trusted" consumer
+// routes through this or `hunkTrustChecker`; both decide per label with
+// `matchesAnyPattern`.
 export function isHunkTrusted(
   hunkState: HunkState | undefined,
   trustList: string[],
@@ -421,6 +433,28 @@ export function isHunkTrusted(
   return anyLabelMatchesAnyPattern(labels, trustList);
 }
 
+// `isHunkTrusted` bound to one trust list, for callers that check every hunk
+// against it. Hunks share a small set of labels, so each distinct label is
+// matched against the list once and the answer reused.
+export function hunkTrustChecker(
+  trustList: string[],
+): (hunkState: HunkState | undefined) => boolean {
+  const labelTrusted = new Map<string, boolean>();
+  const isTrusted = (label: string): boolean => {
+    let trusted = labelTrusted.get(label);
+    if (trusted === undefined) {
+      trusted = matchesAnyPattern(label, trustList);
+      labelTrusted.set(label, trusted);
+    }
+    return trusted;
+  };
+  return (hunkState) => {
+    const labels = hunkState?.classification?.value;
+    if (!labels || labels.length === 0) return false;
+    return labels.some(isTrusted);
+  };
+}
+
 // The effective review status of a hunk, collapsing the axes into one label:
 // an explicit decision wins; otherwise a trust-listed label reads as
 // "trusted"; otherwise "unreviewed". The single source of truth